@@ -16,6 +16,7 @@ class Config:
         USE_EMG (bool): Enable EMG device/channels.
         USE_EEG (bool): Enable EEG device/channels.
         SAVE_COUNTERS (bool): Save SyncStation/Muovi counter channels.
+        SAVE_CSV (bool): Save CSV outputs (text; slow to write for long segments).
         SAVE_H5 (bool): Save HDF5 outputs in addition to CSV (if applicable).
 
         EMG_MODE (int): EMG gain mode (0 → gain 8, 1 → gain 4; 2/3 test).
@@ -45,6 +46,8 @@ class Config:
         MUOVI_PLUS_EEG_CHANNELS (list[int]): Index range of EEG channels.
         MUOVI_PLUS_AUX_CHANNELS (list[int]): Index range of EEG AUX channels.
         SYNCSTATION_CHANNELS (list[int]): Index range of SyncStation channels.
+        MUOVI_EMG_SLICE (slice): `MUOVI_EMG_CHANNELS` as a slice (view, no copy).
+        MUOVI_PLUS_EEG_SLICE (slice): `MUOVI_PLUS_EEG_CHANNELS` as a slice.
 
         SYNCSTATION_COUNTER_CHANNEL (int): SyncStation counter channel index.
         MUOVI_COUNTER_CHANNEL (int): EMG-device counter channel index.
@@ -72,6 +75,7 @@ class Config:
         self.USE_EMG = use_emg
         self.USE_EEG = use_eeg
         self.SAVE_COUNTERS = True
+        self.SAVE_CSV = True
         self.SAVE_H5 = True
 
         # Set the Gain Mode here : 0 -> 8, 1 -> 4
@@ -122,6 +126,10 @@ class Config:
 
         self.SYNCSTATION_CHANNELS = list(range(num_channels_used, num_channels_used + 6))
 
+        # The channel ranges are contiguous, so slicing gives views where fancy indexing would copy
+        self.MUOVI_EMG_SLICE = slice(self.MUOVI_EMG_CHANNELS[0], self.MUOVI_EMG_CHANNELS[-1] + 1)
+        self.MUOVI_PLUS_EEG_SLICE = slice(self.MUOVI_PLUS_EEG_CHANNELS[0], self.MUOVI_PLUS_EEG_CHANNELS[-1] + 1)
+
         self.SYNCSTATION_COUNTER_CHANNEL = self.SYNCSTATION_CHANNELS[4]
         self.MUOVI_COUNTER_CHANNEL = self.MUOVI_AUX_CHANNELS[4]
         self.MUOVI_PLUS_COUNTER_CHANNEL = self.MUOVI_PLUS_AUX_CHANNELS[5]
@@ -9,6 +9,7 @@ matplotlib.use('TkAgg')
 from util.channel_alignment import find_eeg_counter
 from util.OTB_refactored.configuration_processing import process_config
 from config import Config
+from util.plotting import minmax_decimate
 
 # === User configuration: define your raw buffer file here ===
 BUFFER_FILE = Path("../test/buffers", "buffer_both_M3R2.bin")
@@ -18,10 +19,10 @@ config = Config(True, True)
 
 def load_and_align_buffer(buffer_file: Path):
     """
-    Load a raw data buffer from a binary file and apply channel alignment.
-    Returns the aligned buffer and the computed offset.
+    Memory-map a raw data buffer from a binary file and apply channel alignment.
+    Returns the aligned buffer (a read-only uint8 view, no copy) and the computed offset.
     """
-    raw = buffer_file.read_bytes()
+    raw = np.memmap(buffer_file, dtype=np.uint8, mode='r')
     offset = find_eeg_counter(raw)
     print(f"Alignment offset: {offset} bytes")
     if offset:
@@ -29,105 +30,177 @@ def load_and_align_buffer(buffer_file: Path):
     return raw, offset
 
 
-def process_buffer(raw: bytes, tot_num_byte: int, tot_num_chan: int):
+_plan_cache = {}
+
+
+def _get_plan(tot_num_byte: int):
+    """
+    Return the decode plan for the current config, building it on first use.
+
+    The plan lists each enabled device as (is_emg, first output row, first byte)
+    plus the SyncStation output row/byte and the float32 EMG scale, so repeated
+    calls skip the 16-slot device scan.
     """
-    Process an aligned buffer into a (channels x samples) data array.
+    key = (tuple(config.DEVICE_EN), tuple(config.EMG), config.EMG_MODE, tot_num_byte)
+    plan = _plan_cache.get(key)
+    if plan is None:
+        devices = []
+        chan_idx = 0
+        for DevId in range(16):
+            if config.DEVICE_EN[DevId] != 1:
+                continue
+            if config.EMG[DevId] == 1:
+                devices.append((True, chan_idx, 0))
+            else:
+                devices.append((False, chan_idx, config.MUOVI_PLUS_EEG_CHANNELS[0] * 2))
+            chan_idx += config.NUM_CHAN[DevId]
+        emg_scale = np.float32(config.GAIN_RATIOS[config.EMG_MODE] * 1e3)
+        plan = (tuple(devices), chan_idx, tot_num_byte - (6 * 2), emg_scale)
+        _plan_cache[key] = plan
+    return plan
+
+
+def _unpack_24bit(arr: np.ndarray, tot_num_byte: int, start: int, count: int, signed: bool):
+    """
+    Decode `count` consecutive big-endian 24-bit channels starting at byte `start`.
+
+    Each channel is read as an overlapping 4-byte big-endian word straight from
+    the frame buffer (stride 3 within a frame), then shifted right by 8 to drop
+    the trailing byte; an arithmetic shift on the signed word sign-extends in
+    the same pass. Returns a (samples, count) array.
+    """
+    samples = arr.size // tot_num_byte
+    words = np.ndarray((samples, count), dtype=">i4" if signed else ">u4", buffer=arr,
+                       offset=start, strides=(tot_num_byte, 3))
+    return words >> 8
+
+
+def process_buffer(arr: np.ndarray, tot_num_byte: int, tot_num_chan: int, out: np.ndarray = None,
+                   raw_counts: bool = False):
+    """
+    Process an aligned uint8 buffer into a (channels x samples) data array.
+
+    Frames are kept in their native (samples, bytes) layout and decoded with
+    big-endian views, so neither 16-bit nor 24-bit channels need manual byte
+    recombination or a two's complement fixup. Every output row is written by
+    the decode, so the result is allocated uninitialised; pass an `out` of
+    shape (tot_num_chan, samples) and the output dtype to reuse a buffer
+    across calls; a mismatched `out`, or a decode plan that does not cover
+    `tot_num_chan` rows, raises ValueError.
+
+    By default EMG is scaled to mV in float32. With `raw_counts=True` no
+    scaling is applied and a tuple `(emg, wide, (scale_emg, scale_eeg))` is
+    returned instead: `emg` holds each EMG device's signed 16-bit channels
+    as int16 (half the bytes of float32), `wide` holds every other row
+    (unsigned aux, 24-bit EEG, SyncStation) as int32 in channel order, and
+    the scales convert counts to mV. `out` cannot be combined with
+    `raw_counts`.
     """
     # Trim incomplete sample at start
-    rem = len(raw) % tot_num_byte
+    rem = arr.size % tot_num_byte
     if rem:
-        raw = raw[rem:]
+        arr = arr[rem:]
 
-    arr = np.frombuffer(raw, dtype=np.uint8)
     samples = arr.size // tot_num_byte
-    temp = arr.reshape((samples, tot_num_byte)).T  # shape: (bytes, samples)
-
-    # container for reconstructed channels
-    data = np.zeros((tot_num_chan, samples), dtype=np.float32)
-    chan_idx = 0
+    temp = arr.reshape((samples, tot_num_byte))  # shape: (samples, bytes), no transpose copy
+
+    devices, sync_idx, sync_start, emg_scale = _get_plan(tot_num_byte)
+    # The output is left uninitialised, so every row must be covered by the decode
+    if sync_idx + 6 != tot_num_chan:
+        raise ValueError(f"decode plan covers {sync_idx + 6} channels but tot_num_chan is {tot_num_chan}")
+
+    if raw_counts:
+        if out is not None:
+            raise ValueError("out cannot be used with raw_counts=True")
+        return _decode_counts(arr, temp, tot_num_byte, tot_num_chan, devices, sync_start)
+
+    # container for reconstructed channels (fully overwritten below)
+    if out is None:
+        out = np.empty((tot_num_chan, samples), dtype=np.float32)
+    elif out.shape != (tot_num_chan, samples) or out.dtype != np.float32:
+        raise ValueError(f"out must be float32 with shape {(tot_num_chan, samples)}, "
+                         f"got {out.dtype} with shape {out.shape}")
+    data = out
 
     # Per-device data
-    for DevId in range(16):
-        if config.DEVICE_EN[DevId] != 1:
-            continue
-        if config.EMG[DevId] == 1:
-            # EMG channels
-            ch_ind = np.arange(0, 33*2, 2)
-            ch_ind_aux = np.arange(33*2, 38*2, 2)
-            sub = temp[ch_ind].astype(np.int32) * 256 + temp[ch_ind+1].astype(np.int32)
-            sub_aux = temp[ch_ind_aux].astype(np.int32) * 256 + temp[ch_ind_aux+1].astype(np.int32)
-
-            # two's complement
-            neg = sub >= 32768
-            sub[neg] -= 65536
-            # convert to mV
-            sub = sub * config.EMG_GAIN_RATIOS[config.EMG_MODE] * 1e3
-
-            data[chan_idx:chan_idx+33, :] = sub
-            data[chan_idx+33:chan_idx+38, :] = sub_aux
-            chan_idx += config.NUM_CHAN[DevId]
+    for is_emg, chan_idx, start in devices:
+        if is_emg:
+            # EMG channels: signed big-endian 16-bit, aux unsigned
+            sub = temp[:, start:start + 33*2].view(">i2")
+            sub_aux = temp[:, start + 33*2:start + 38*2].view(">u2")
+
+            # convert to mV straight into the output rows
+            np.multiply(sub.T, emg_scale, out=data[chan_idx:chan_idx+33, :])
+            data[chan_idx+33:chan_idx+38, :] = sub_aux.T
         else:
-            # EEG channels
-            start = config.MUOVI_PLUS_EEG_CHANNELS[0] * 2
-            ch_ind = np.arange(start, start + 64*3, 3)
-            ch_ind_aux = np.arange(start + 64*3, start + 64*3 + 6*3, 3)
-            sub = (temp[ch_ind].astype(np.int32) * 65536 +
-                   temp[ch_ind+1].astype(np.int32) * 256 +
-                   temp[ch_ind+2].astype(np.int32))
-            sub_aux = (temp[ch_ind_aux].astype(np.int32) * 65536 +
-                       temp[ch_ind_aux+1].astype(np.int32) * 256 +
-                       temp[ch_ind_aux+2].astype(np.int32))
-
-            neg = sub >= 8388608
-            sub[neg] -= 16777216
-
-            data[chan_idx:chan_idx+64, :] = sub
-            data[chan_idx+64:chan_idx+70, :] = sub_aux
-            chan_idx += config.NUM_CHAN[DevId]
+            # EEG channels: big-endian 24-bit, aux unsigned
+            aux_start = start + 64*3
+            sub = _unpack_24bit(arr, tot_num_byte, start, 64, signed=True)
+            sub_aux = _unpack_24bit(arr, tot_num_byte, aux_start, 6, signed=False)
+
+            data[chan_idx:chan_idx+64, :] = sub.T
+            data[chan_idx+64:chan_idx+70, :] = sub_aux.T
 
     # syncstation auxiliary channels
-    aux_start = tot_num_byte - (6 * 2)
-    ch_ind = np.arange(aux_start, aux_start + 6*2, 2)
-    aux = temp[ch_ind].astype(np.int32) * 256 + temp[ch_ind+1].astype(np.int32)
-    data[chan_idx:chan_idx+6, :] = aux
+    data[sync_idx:sync_idx+6, :] = temp[:, sync_start:sync_start + 6*2].view(">u2").T
 
     return data
 
 
+def _decode_counts(arr, temp, tot_num_byte, tot_num_chan, devices, sync_start):
+    """
+    Decode unscaled ADC counts for `process_buffer(..., raw_counts=True)`.
+
+    Signed EMG channels go to an int16 array (device order); all other rows
+    keep channel order in an int32 array, since 24-bit EEG and the unsigned
+    16-bit aux/counter values do not fit int16.
+    """
+    samples = temp.shape[0]
+    num_emg = 33 * sum(is_emg for is_emg, _, _ in devices)
+    emg = np.empty((num_emg, samples), dtype=np.int16)
+    wide = np.empty((tot_num_chan - num_emg, samples), dtype=np.int32)
+
+    emg_row = wide_row = 0
+    for is_emg, _, start in devices:
+        if is_emg:
+            emg[emg_row:emg_row+33, :] = temp[:, start:start + 33*2].view(">i2").T
+            wide[wide_row:wide_row+5, :] = temp[:, start + 33*2:start + 38*2].view(">u2").T
+            emg_row += 33
+            wide_row += 5
+        else:
+            wide[wide_row:wide_row+64, :] = _unpack_24bit(arr, tot_num_byte, start, 64, signed=True).T
+            wide[wide_row+64:wide_row+70, :] = _unpack_24bit(arr, tot_num_byte, start + 64*3, 6, signed=False).T
+            wide_row += 70
+    wide[wide_row:wide_row+6, :] = temp[:, sync_start:sync_start + 6*2].view(">u2").T
+
+    scales = (config.GAIN_RATIOS[config.EMG_MODE] * 1e3, config.GAIN_RATIOS[config.EEG_MODE] * 1e3)
+    return emg, wide, scales
+
+
 def plot_alignment(data: np.ndarray):
     """
-    Plot key channels to visualize alignment with wider figures.
+    Plot key channels to visualize alignment in one wide figure.
+
+    The three traces share a single window (one Tk/Agg render instead of
+    three blocking figures) and are min/max decimated to screen resolution.
     """
     sync_counter = data[config.SYNCSTATION_CHANNELS[-1]]
     print("syncstation counter index:", config.SYNCSTATION_CHANNELS[-1])
     print("Data shape:", data.shape)
 
-    # Wider figure for counters
-    plt.figure(figsize=(12, 6))
-    plt.plot(sync_counter, label='SyncStation Counter')
-    plt.xlabel('Sample Index')
-    plt.ylabel('Counter Value')
-    plt.title('SyncStation Counter After Alignment')
-    plt.legend()
-    plt.tight_layout()
-    plt.show()
-
-    # Wider figure for EMG channel 0
-    plt.figure(figsize=(12, 6))
-    plt.plot(data[0], label='EMG Ch 1')
-    plt.xlabel('Sample Index')
-    plt.ylabel('Signal (mV)')
-    plt.title('EMG Channel 1 After Processing')
-    plt.tight_layout()
-    plt.show()
-
-    # Wider figure for EMG channel 32
-    plt.figure(figsize=(12, 6))
-    plt.plot(data[32], label='EMG Ch 32')
-    plt.xlabel('Sample Index')
-    plt.ylabel('Signal (mV)')
-    plt.title('EMG Channel 32 After Processing')
-    plt.tight_layout()
+    traces = [
+        (sync_counter, 'SyncStation Counter', 'Counter Value', 'SyncStation Counter After Alignment'),
+        (data[0], 'EMG Ch 1', 'Signal (mV)', 'EMG Channel 1 After Processing'),
+        (data[32], 'EMG Ch 32', 'Signal (mV)', 'EMG Channel 32 After Processing'),
+    ]
+    fig, axes = plt.subplots(nrows=len(traces), ncols=1, figsize=(12, 12), sharex=True)
+    for ax, (signal, label, ylabel, title) in zip(axes, traces):
+        ax.plot(*minmax_decimate(signal), label=label)
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
+        ax.legend()
+    axes[-1].set_xlabel('Sample Index')
+    fig.tight_layout()
     plt.show()
 
 # === Run alignment test ===
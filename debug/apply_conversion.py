@@ -6,6 +6,7 @@ import matplotlib
 from config import Config
 import util.filters as filters
 from view_csv import plot_file, plot_channel
+from util.file_pathing import load_csv, write_csv
 
 matplotlib.use('TkAgg')
 
@@ -19,7 +20,7 @@ def convert_file(file_path):
     config = Config(False, True)
 
 
-    data = np.loadtxt(file_path, delimiter=',')
+    data = load_csv(file_path)
     data = data.transpose()
 
     print(data.shape)
@@ -27,7 +28,7 @@ def convert_file(file_path):
     data = data * config.GAIN_RATIOS[config.EEG_MODE] * 1e3
 
     outfile = file_path.split('.cs')[0] + "_converted.csv"
-    np.savetxt(outfile, data.transpose(), delimiter=',')
+    write_csv(outfile, data.transpose())
     print("Conversion Complete for", file_path.split("/")[-1])
     print("Saved to", outfile)
     return outfile
@@ -12,16 +12,13 @@ def _chan_off_w(ch: int) -> Tuple[int, int]:
 
 def _read_series(base_off: int, buf: bytes, ch: int, n_frames: int) -> Tuple[np.ndarray, int]:
     off, w = _chan_off_w(ch)
-    vals = np.empty(n_frames, dtype=np.uint32)
+    # View the frames as rows (no copy) and pick the channel's bytes as columns
+    frames = np.frombuffer(buf, dtype=np.uint8, count=n_frames * FRAME_SIZE, offset=base_off)
+    b = frames.reshape(n_frames, FRAME_SIZE)[:, off:off + w].astype(np.uint32)
     if w == 2:
-        for i in range(n_frames):
-            p = base_off + off + i * FRAME_SIZE
-            vals[i] = int.from_bytes(buf[p:p+2], "big", signed=False)
+        vals = (b[:, 0] << 8) | b[:, 1]
     else:  # w == 3, big-endian
-        for i in range(n_frames):
-            p = base_off + off + i * FRAME_SIZE
-            b = buf[p:p+3]
-            vals[i] = (b[0] << 16) | (b[1] << 8) | b[2]
+        vals = (b[:, 0] << 16) | (b[:, 1] << 8) | b[:, 2]
     return vals, w
 
 def _score_periodic_counter(vals: np.ndarray, width_bytes: int, period: int) -> Tuple[float, int]:
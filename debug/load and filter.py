@@ -6,6 +6,7 @@ import matplotlib
 from config import Config
 import util.filters as filters
 from view_csv import plot_file, plot_channel
+from util.file_pathing import load_csv, write_csv
 
 matplotlib.use('TkAgg')
 
@@ -18,7 +19,7 @@ def filter_file(file_path):
     """
 
 
-    data = np.loadtxt(file_path, delimiter=',')
+    data = load_csv(file_path)
     data = data.transpose()
 
     print(data.shape)
@@ -26,7 +27,7 @@ def filter_file(file_path):
     data = filter_pipeline(data)
 
     outfile = file_path.split('.cs')[0] + "_filtered.csv"
-    np.savetxt(outfile, data.transpose(), delimiter=',')
+    write_csv(outfile, data.transpose())
     print("Filtering Complete for", file_path.split("/")[-1])
     print("Saved to", outfile)
     return outfile
@@ -1,8 +1,8 @@
 import socket
-import struct
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib
+from matplotlib.collections import LineCollection
 matplotlib.use('TkAgg')
 
 
@@ -152,7 +152,7 @@ tcpSocket.connect(('192.168.76.1', TCPPort))
 print("Connesso al Socket!")
 # Send the configuration to syncstation
 StartCommand = ConfString[0:ConfStrLen]
-packed_data = struct.pack('B' * ConfStrLen, *StartCommand)
+packed_data = bytes(StartCommand)
 
 datainviati= tcpSocket.sendall(packed_data)
 print("Inviato Start Command")
@@ -165,12 +165,43 @@ tcpSocket.settimeout(10)
 
 # CANALI DEL MUOVI
 fig = plt.figure()
-plt.xlim([0, sampFreq * PlotTime])
-
-all_cycles = []
+ax = fig.add_subplot()
+ax.set_xlim([0, sampFreq * PlotTime])
+
+# All traces live in one LineCollection built once; each cycle only refreshes its segments.
+# EMG channels are stacked OffsetEMG apart per device, AUX and SyncStation channels are unshifted.
+plot_chans = []
+plot_offsets = []
+for emg_chans, aux_chans, not_connected in ((muoviEMGChan, muoviAUXChan, NoMuoviConnected),
+                                            (sessnEMGChan, sessnAUXChan, NoSessanConnected),
+                                            (duePlEMGChan, duePlAUXChan, NoDuePlusConnected)):
+    if not_connected == 0:
+        plot_chans += emg_chans + aux_chans
+        plot_offsets += [OffsetEMG * k for k in range(len(emg_chans))] + [0] * len(aux_chans)
+plot_chans += SyncStatChan
+plot_offsets += [0] * len(SyncStatChan)
+plot_chans = np.array(plot_chans)
+plot_offsets = np.array(plot_offsets, dtype=float)[:, None]
+
+segments = np.empty((len(plot_chans), sampFreq * PlotTime, 2))
+segments[:, :, 0] = np.arange(sampFreq * PlotTime)
+# The traces are animated: they are blitted over a cached background of the axes rather than
+# triggering a full figure redraw every cycle. The background is only re-rendered when the data
+# outgrows the current y-limits.
+line_collection = LineCollection([], colors=plt.rcParams['axes.prop_cycle'].by_key()['color'], animated=True)
+ax.add_collection(line_collection)
+plt.show(block=False)
+background = None
+
+all_cycles = np.empty((NumCycles, sampFreq * PlotTime, TotNumChan + 1))  # one (samples, channels) block per cycle
+
+# Byte offsets of each channel within a frame only depend on the configuration, so build them once
+DevChInd = {DevId: np.arange(0, NumChan[DevId] * (2 if EMG[DevId] == 1 else 3), 2 if EMG[DevId] == 1 else 3)
+            for DevId in range(16) if DeviceEN[DevId] == 1}
+AUXStartingByte = TotNumByte - (6*2)
+AUXChInd = np.arange(AUXStartingByte, AUXStartingByte+12, 2)
 
 for i in range(NumCycles):
-    plt.cla()
     print(i)
 
     ChanReady = 1
@@ -191,78 +222,48 @@ for i in range(NumCycles):
     for DevId in range(16):
         if DeviceEN[DevId] == 1:
             if EMG[DevId] == 1:
-                ChInd = np.arange(0, NumChan[DevId] * 2, 2)
-                DataSubMatrix = Temp[ChInd].astype(np.int32)*256 + Temp[ChInd+1].astype(np.int32)
-
-                # Search for the negative values and make the two's complement
-                ind = np.where(DataSubMatrix >= 32768)
-                DataSubMatrix[ind] = DataSubMatrix[ind] - 65536
+                ChInd = DevChInd[DevId]
+                # Reading the high byte as int8 sign-extends, giving the two's complement directly
+                DataSubMatrix = (Temp[ChInd].view(np.int8).astype(np.int32) << 8) | Temp[ChInd + 1]
 
                 data[ChanReady:ChanReady + NumChan[DevId], :] = DataSubMatrix
             else:
-                ChInd = np.arange(0, NumChan[DevId] * 3, 3)
-                DataSubMatrix = Temp[ChInd].astype(np.int32) * 65536 + Temp[ChInd + 1].astype(np.int32) * 256 + Temp[ChInd + 2].astype(np.int32)
-
-                # Search for the negative values and make the two's complement
-                ind = np.where(DataSubMatrix >= 8388608)
-                DataSubMatrix[ind] = DataSubMatrix[ind] - 16777216
+                ChInd = DevChInd[DevId]
+                # Reading the high byte as int8 sign-extends, giving the two's complement directly
+                DataSubMatrix = (Temp[ChInd].view(np.int8).astype(np.int32) << 16) | \
+                                (Temp[ChInd + 1].astype(np.int32) << 8) | Temp[ChInd + 2]
 
                 data[ChanReady:ChanReady + NumChan[DevId], :] = DataSubMatrix
 
             del ChInd
-            del ind
             del DataSubMatrix
             ChanReady += NumChan[DevId]
 
-    AUXStartingByte = TotNumByte - (6*2)
-    ChInd = np.arange(AUXStartingByte, AUXStartingByte+12, 2)
-    DataSubMatrix = Temp[ChInd].astype(np.int32) * 256 + Temp[ChInd + 1].astype(np.int32)
-
-    # Search for the negative values and make the two's complement
-    ind = np.where(DataSubMatrix >= 32768)
-    DataSubMatrix[ind] = DataSubMatrix[ind] - 65536
+    ChInd = AUXChInd
+    # Reading the high byte as int8 sign-extends, giving the two's complement directly
+    DataSubMatrix = (Temp[ChInd].view(np.int8).astype(np.int32) << 8) | Temp[ChInd + 1]
 
     data[ChanReady:ChanReady + 6, :] = DataSubMatrix
-    del ind
     del DataSubMatrix
 
     # Aggiornamento istruzioni per il tracciamento del grafico
-    k = 0
-
-    if NoMuoviConnected == 0:
-        k = 0
-        for j in muoviEMGChan:
-            plt.plot(data[j, :] + OffsetEMG * k)
-            k += 1
-        for j in muoviAUXChan:
-            plt.plot(data[j, :])
-
-    if NoSessanConnected == 0:
-        k = 0
-        for j in sessnEMGChan:
-            plt.plot(data[j, :] + OffsetEMG * k)
-            k += 1
-        for j in sessnAUXChan:
-            plt.plot(data[j, :])
-
-    if NoDuePlusConnected == 0:
-        k = 0
-        for j in duePlEMGChan:
-            plt.plot(data[j, :] + OffsetEMG * k)
-            k += 1
-        for j in duePlAUXChan:
-            plt.plot(data[j, :])
-
-    for j in SyncStatChan:
-        #lineSyncChannel.set_data(data[j, :], np.linspace(0, 1, len(data[j, :])))
-        plt.plot(data[j, :])
-    all_cycles.append(data.copy().transpose())
-    plt.pause(0.01)  # Pausa per consentire il rendering e l'aggiornamento dei plot
-    plt.draw()
+    segments[:, :, 1] = data[plot_chans] + plot_offsets
+    line_collection.set_segments(segments)
+    all_cycles[i] = data.T
+    y_min, y_max = segments[:, :, 1].min(), segments[:, :, 1].max()
+    y_lo, y_hi = ax.get_ylim()
+    if background is None or y_min < y_lo or y_max > y_hi:
+        ax.set_ylim(y_min, y_max)
+        fig.canvas.draw()
+        background = fig.canvas.copy_from_bbox(ax.bbox)
+    else:
+        fig.canvas.restore_region(background)
+    ax.draw_artist(line_collection)
+    fig.canvas.blit(ax.bbox)
+    fig.canvas.flush_events()
 
 
 # Saving
-all_cycles = np.array(all_cycles)  # shape = (NumCycles, TotNumChan+1, sampFreq*PlotTime)
 C, R, T = all_cycles.shape   # cycles, channels, time
 csv_2d = all_cycles.reshape(C * R, T)
 np.savetxt("eeg_debug.csv", csv_2d, delimiter=",")
@@ -275,7 +276,7 @@ for i in range(18):
     ConfString[i] = 0
 ConfString[1] = CRC8(ConfString, 1)
 StopCommand = ConfString[0:1]
-packed_data = struct.pack('B' * len(StopCommand), *StopCommand)
+packed_data = bytes(StopCommand)
 
 print("Mandato comando di Stop")
 datainviati= tcpSocket.sendall(packed_data)
@@ -283,4 +284,5 @@ datainviati= tcpSocket.sendall(packed_data)
 # Close the TCP socket
 tcpSocket.close()
 
+line_collection.set_animated(False)  # let the final window draw the traces normally
 plt.show()  # Mostra tutte le figure alla fine del ciclo
@@ -23,15 +23,25 @@ Behavior aligned with the "real" timer UI:
 
 import sys
 import os
-from PyQt5.QtWidgets import QApplication, QLabel, QWidget, QVBoxLayout
-from PyQt5.QtGui import QMovie, QPixmap, QPainter, QPen, QColor
-from PyQt5.QtCore import Qt, QTimer, QRectF
+import logging
+from functools import wraps
+from PyQt5.QtWidgets import QApplication, QLabel, QWidget, QVBoxLayout, QHBoxLayout
+from PyQt5.QtGui import QMovie, QPixmap, QPixmapCache, QPainter, QPen, QColor
+from PyQt5.QtCore import Qt, QTimer, QRectF, QElapsedTimer
 
 from util.images import Images
 
+log = logging.getLogger(__name__)
+
 
 class RadialProgress(QWidget):
-    """Circular progress indicator for countdowns with dynamic color."""
+    """Circular progress indicator for countdowns with dynamic color.
+
+    The countdown is driven by one persistent QTimer that ticks every
+    `TICK_MS` and derives the remaining time from a QElapsedTimer.
+    """
+
+    TICK_MS = 50
 
     def __init__(self, diameter=100, thickness=8, parent=None):
         """
@@ -46,45 +56,66 @@ class RadialProgress(QWidget):
         self.setFixedSize(diameter, diameter)
         self._total_ms = 1
         self._remaining_ms = 1
+        self._span = 360 * 16  # arc span in 1/16 degree, whole degrees only
         self._arc_color = QColor("#525c63")  # default; will be set per phase
+        # Paint geometry and pens are fixed per widget; only the arc pen's color changes
+        self._rect = QRectF(thickness / 2, thickness / 2, diameter - thickness, diameter - thickness)
+        self._base_pen = QPen(QColor("#ddd"), thickness)
+        self._arc_pen = QPen(self._arc_color, thickness)
+        self._elapsed = QElapsedTimer()
+        self._tick_timer = QTimer(self)
+        self._tick_timer.setInterval(self.TICK_MS)
+        # Arc animation tolerates ~5% jitter; let Qt batch these wakeups with others
+        self._tick_timer.setTimerType(Qt.CoarseTimer)
+        self._tick_timer.timeout.connect(self._on_tick)
 
     def set_color(self, qcolor: QColor):
         """Set the arc color for the next/ongoing phase."""
         self._arc_color = qcolor
+        self._arc_pen.setColor(qcolor)
         self.update()
 
     def start(self, total_ms: int):
         """Start a new countdown with a given duration."""
         self._total_ms = max(1, int(total_ms))
         self._remaining_ms = self._total_ms
+        self._span = 360 * 16
+        self._elapsed.start()
+        self._tick_timer.start()
         self.update()
 
+    def stop(self):
+        """Stop the countdown, leaving the arc where it is."""
+        self._tick_timer.stop()
+
+    def _on_tick(self):
+        """Advance the arc from the elapsed time; stop once it reaches zero."""
+        remaining_ms = self._total_ms - self._elapsed.elapsed()
+        if remaining_ms <= 0:
+            self._tick_timer.stop()
+        self.update_value(remaining_ms)
+
     def update_value(self, remaining_ms: int):
-        """Update the remaining milliseconds for the arc display."""
+        """Update the remaining milliseconds for the arc display.
+
+        A repaint is only scheduled when the arc moves by at least one degree.
+        """
         self._remaining_ms = max(0, int(remaining_ms))
-        self.update()
+        span = 360 * min(self._remaining_ms, self._total_ms) // self._total_ms * 16
+        if span != self._span:
+            self._span = span
+            self.update()
 
     def paintEvent(self, event):
         """Custom paint event to draw the background circle and progress arc."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        rect = QRectF(
-            self.thickness / 2,
-            self.thickness / 2,
-            self.diameter - self.thickness,
-            self.diameter - self.thickness,
-        )
         # Base circle
-        pen = QPen(QColor("#ddd"), self.thickness)
-        painter.setPen(pen)
-        painter.drawEllipse(rect)
+        painter.setPen(self._base_pen)
+        painter.drawEllipse(self._rect)
         # Progress arc
-        if self._total_ms > 0:
-            frac = max(0.0, min(1.0, self._remaining_ms / self._total_ms))
-            span = int(360 * frac * 16)
-            pen.setColor(self._arc_color)
-            painter.setPen(pen)
-            painter.drawArc(rect, 90 * 16, -span)
+        painter.setPen(self._arc_pen)
+        painter.drawArc(self._rect, 90 * 16, -self._span)
 
 
 # Movement GIFs (change these to actual paths to your .gif files)
@@ -103,6 +134,25 @@ repeats_per_movement = 2    # number of times each movement is shown
 rest_between_movements = rest_between_repeats
 
 
+def _batched_repaint(method):
+    """Run a phase handler with widget updates suspended, then repaint once.
+
+    Phase handlers swap several pixmaps/texts in a row; suspending updates
+    lets Qt lay out and paint the window once for the whole transition.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.updatesEnabled():
+            # Nested handler call; the outermost one re-enables updates
+            return method(self, *args, **kwargs)
+        self.setUpdatesEnabled(False)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.setUpdatesEnabled(True)
+    return wrapper
+
+
 class GifExerciseViewer(QWidget):
     """PyQt5 application for displaying movement GIFs and guiding exercise cycles."""
 
@@ -115,8 +165,6 @@ class GifExerciseViewer(QWidget):
         self.setWindowTitle("Practice Movements")
         self.setFixedSize(1000, 600)
 
-        from PyQt5.QtWidgets import QHBoxLayout
-
         # Layout setup
         self.main_layout = QVBoxLayout()
         self.setLayout(self.main_layout)
@@ -124,8 +172,12 @@ class GifExerciseViewer(QWidget):
 
         # Preview image (next movement / current phase preview)
         self.preview_label = QLabel(self)
-        self.preview_label.setScaledContents(True)
         self.preview_label.setFixedSize(280, 125)
+        # Border is selected by the `highlight` property so toggling it never reparses a stylesheet
+        self.preview_label.setStyleSheet(
+            "QLabel[highlight='true'] { border: 2px solid red; } QLabel[highlight='false'] { border: 0px; }"
+        )
+        self._preview_highlight = None
 
         preview_container = QVBoxLayout()
         preview_container.addWidget(self.preview_label)
@@ -139,7 +191,6 @@ class GifExerciseViewer(QWidget):
 
         # Current GIF display
         self.gif_label = QLabel(self)
-        self.gif_label.setScaledContents(True)
         self.gif_label.setFixedSize(650, 325)
         self.gif_label.setStyleSheet("color: black; font-size: 36px;")
         self.content_layout.addWidget(self.gif_label, stretch=1)
@@ -164,157 +215,232 @@ class GifExerciseViewer(QWidget):
 
         # State
         self.gif_list = gif_list
+        # Display names derived once from the GIF filenames (e.g. "M1.gif" -> "M1")
+        self._movement_names = [os.path.basename(path).replace(".gif", "").replace("_", " ") for path in gif_list]
         # Use PNG previews from util.images to mirror the real timer’s visuals
         self.preview_images = Images.MOVEMENT_IMAGES_A + Images.MOVEMENT_IMAGES_B
+        # Resolve which image/GIF files exist once, so phase changes never stat the disk
+        self._existing_paths = frozenset(
+            path for path in [*self.preview_images, *self.gif_list, rest_image_path] if os.path.exists(path)
+        )
         self.current_index = 0      # which movement
         self.current_repeat = 0     # 0..repeats_per_movement-1
         self.movie = None
+        # Pre-scaled pixmaps live in Qt's process-wide cache (see `_pixmap`); room for all previews + rest
+        QPixmapCache.setCacheLimit(32 * 1024)
         self.resting = False
         self.between_movements = False
-        self._radial_job_active = False
+
+        # The whole session is one precomputed phase list walked by a single
+        # single-shot timer; stopping `_phase_timer` cancels the session.
+        self._schedule = self._build_schedule()
+        self._step = 0
+        self._phase_timer = QTimer(self)
+        self._phase_timer.setSingleShot(True)
+        self._phase_timer.timeout.connect(self._advance)
 
         # Start with pre-movement rest for the very first movement (fixed 5s)
-        self.show_pre_movement_rest(first=True)
+        self._advance()
+
+    def _pixmap(self, path: str, label: QLabel) -> QPixmap:
+        """Return `path` decoded and smooth-scaled to fill `label`, loading it on first use.
+
+        The labels have fixed sizes, so scaling once here replaces the per-label
+        rescale that `setScaledContents` would redo whenever the pixmap changes.
+        """
+        size = label.size()
+        key = f"{path}@{size.width()}x{size.height()}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = QPixmap(path).scaled(size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def _set_preview_highlight(self, on: bool):
+        """Show or hide the red preview border, re-polishing only on change."""
+        if on == self._preview_highlight:
+            return
+        self._preview_highlight = on
+        self.preview_label.setProperty("highlight", on)
+        style = self.preview_label.style()
+        style.unpolish(self.preview_label)
+        style.polish(self.preview_label)
 
     # ---------------- Phase orchestration ----------------
 
+    def _build_schedule(self):
+        """Lay out the whole session as a flat list of phases.
+
+        Returns:
+            list[tuple[callable, int, int]]: `(handler, movement index, repeat)`
+                entries in playback order. Each handler sets up its phase and
+                returns the phase duration in milliseconds.
+        """
+        schedule = []
+        for index in range(len(self.gif_list)):
+            schedule.append((self.show_pre_movement_rest, index, 0))
+            for repeat in range(repeats_per_movement):
+                schedule.append((self.start_movement, index, repeat))
+                # Inter-rep rest only between reps, never after the last one
+                if repeat + 1 < repeats_per_movement:
+                    schedule.append((self.show_inter_rep_rest, index, repeat))
+        return schedule
+
+    @_batched_repaint
+    def _advance(self):
+        """End the current phase and start the next scheduled one."""
+        # Stop the radial updates (and any playing GIF) before the next phase
+        self.radial.stop()
+        if self.movie is not None:
+            self.movie.stop()
+
+        if self._step >= len(self._schedule):
+            self._complete_session()
+            return
+
+        handler, index, repeat = self._schedule[self._step]
+        self._step += 1
+        if index != self.current_index:
+            self._release_movie()
+        self.current_index = index
+        self.current_repeat = repeat
+
+        self._phase_timer.start(handler())
+
     def _phase_start(self, duration_ms: int, color: str, time_label_prefix: str):
         """Common per-phase UI updates (color, fixed time label, radial start)."""
         # Set arc color
         self.radial.set_color(QColor(color))
         # Show fixed total phase time (no ticking)
         self.timer_label.setText(f"{time_label_prefix}: {duration_ms / 1000:.1f} s")
-        # Start the arc and loop
+        # Start the arc; the widget's own timer animates it
         self.radial.start(duration_ms)
-        self._radial_job_active = True
-        self._radial_loop(duration_ms)
 
-    def _radial_loop(self, remaining_ms: int):
-        """Update the radial progress every 50 ms without changing the time label."""
-        if not self._radial_job_active:
-            return
-        if remaining_ms > 0:
-            self.radial.update_value(remaining_ms)
-            QTimer.singleShot(50, lambda: self._radial_loop(remaining_ms - 50))
-        else:
-            # ensure it ends at 0
-            self.radial.update_value(0)
+    def _load_movie(self, gif_path: str):
+        """Make `self.movie` the QMovie for `gif_path`, decoding all its frames now.
 
-    def _phase_finish(self, callback):
-        """Finish handler to call the next step after a short tick."""
-        # Stop the radial updates right before calling the next phase
-        self._radial_job_active = False
-        QTimer.singleShot(0, callback)
+        Walking every frame once fills the CacheAll cache, so playback never
+        decodes; repeats of the same movement reuse the already decoded movie.
+        """
+        if self.movie is None or self.movie.fileName() != gif_path:
+            self.movie = QMovie(gif_path)
+            self.movie.setCacheMode(QMovie.CacheAll)
+            self.movie.setSpeed(100)
+            self.movie.setScaledSize(self.gif_label.size())
+            for frame in range(self.movie.frameCount()):
+                self.movie.jumpToFrame(frame)
+            self.movie.jumpToFrame(0)
+
+    def _release_movie(self):
+        """Drop the finished movement's QMovie so its cached frames are freed now."""
+        if self.movie is not None:
+            self.movie.stop()
+            self.movie.deleteLater()
+            self.movie = None
 
     # ---------------- Pre-movement rest ----------------
 
-    def show_pre_movement_rest(self, first: bool = False):
-        """Show pre-movement rest (UI only). First movement uses a fixed 5s."""
+    def show_pre_movement_rest(self) -> int:
+        """Show pre-movement rest (UI only). First movement uses a fixed 5s.
+
+        Returns:
+            int: Phase duration in milliseconds.
+        """
         self.resting = True
         self.between_movements = True
 
         # Preview of the upcoming movement with a red border
         if self.current_index < len(self.preview_images):
             preview_path = self.preview_images[self.current_index]
-            if os.path.exists(preview_path):
-                self.preview_label.setPixmap(QPixmap(preview_path))
+            if preview_path in self._existing_paths:
+                self.preview_label.setPixmap(self._pixmap(preview_path, self.preview_label))
             else:
                 self.preview_label.setText("Preview not found")
-        self.preview_label.setStyleSheet("border: 2px solid red;")
+        self._set_preview_highlight(True)
 
         # Show rest image in main area
-        if os.path.exists(rest_image_path):
-            rest_pixmap = QPixmap(rest_image_path)
-            self.gif_label.setPixmap(rest_pixmap)
+        if rest_image_path in self._existing_paths:
+            self.gif_label.setPixmap(self._pixmap(rest_image_path, self.gif_label))
         else:
             self.gif_label.setText("Rest")
 
+        # Decode the upcoming GIF while resting so the movement starts without a decode stall
+        gif_path = self.gif_list[self.current_index]
+        if gif_path in self._existing_paths:
+            self._load_movie(gif_path)
+
         # Status and fixed time
         self.status_label.setText(f"Resting before movement {self.current_index + 1}")
 
-        duration_ms = INITIAL_BASELINE_MS if first else rest_between_movements
+        duration_ms = INITIAL_BASELINE_MS if self.current_index == 0 else rest_between_movements
         self._phase_start(duration_ms, color="red", time_label_prefix="Time")
-        # When done, start the movement
-        QTimer.singleShot(duration_ms, lambda: self._phase_finish(self.start_movement))
+        return duration_ms
 
     # ---------------- Movement ----------------
 
-    def start_movement(self):
-        """Begin/continue the movement phase for the current movement."""
+    def start_movement(self) -> int:
+        """Begin/continue the movement phase for the current movement.
+
+        Returns:
+            int: Phase duration in milliseconds (0 if the GIF is missing).
+        """
         self.resting = False
         self.between_movements = False
 
         # Remove red border from preview during movement
-        self.preview_label.setStyleSheet("border: 0px;")
-
-        if self.current_index >= len(self.gif_list):
-            self._complete_session()
-            return
+        self._set_preview_highlight(False)
 
         gif_path = self.gif_list[self.current_index]
-        if not os.path.exists(gif_path):
-            print("File not found:", gif_path)
+        if gif_path not in self._existing_paths:
+            log.warning("File not found: %s", gif_path)
             self.gif_label.setText("Missing file")
             self.status_label.setText("Missing file")
             # On missing file, behave like a zero-duration movement and progress
-            QTimer.singleShot(0, self._after_movement_phase)
-            return
+            return 0
 
-        # Load and play movement GIF
-        self.movie = QMovie(gif_path)
-        self.movie.setCacheMode(QMovie.CacheAll)
-        self.movie.setSpeed(100)
+        # Play the movement GIF; usually already loaded during the pre-movement
+        # rest, and start() rewinds it to frame 0 for every repeat
+        self._load_movie(gif_path)
         self.gif_label.setMovie(self.movie)
         self.movie.start()
 
         # During movement, preview shows the (static) rest image
-        if os.path.exists(rest_image_path):
-            self.preview_label.setPixmap(QPixmap(rest_image_path))
+        if rest_image_path in self._existing_paths:
+            self.preview_label.setPixmap(self._pixmap(rest_image_path, self.preview_label))
         else:
             self.preview_label.setText("Rest image not found")
 
-        movement_name = os.path.basename(gif_path).replace(".gif", "").replace("_", " ")
+        movement_name = self._movement_names[self.current_index]
         self.status_label.setText(
             f"Performing: {movement_name} (Repeat {self.current_repeat + 1}/{repeats_per_movement})"
         )
 
         self._phase_start(movement_duration, color="green", time_label_prefix="Time")
-        # When movement duration ends, decide next step (inter-rep rest or pre-movement rest)
-        QTimer.singleShot(movement_duration, lambda: self._phase_finish(self._after_movement_phase))
-
-    def _after_movement_phase(self):
-        """Called after a movement finishes; decide next phase."""
-        # If more reps remain for this movement -> inter-rep rest
-        if (self.current_repeat + 1) < repeats_per_movement:
-            self.show_inter_rep_rest()
-        else:
-            # Final rep of this movement -> advance to next movement’s pre-movement rest
-            self.current_repeat = 0
-            self.current_index += 1
-            if self.current_index >= len(self.gif_list):
-                self._complete_session()
-            else:
-                self.show_pre_movement_rest(first=False)
+        return movement_duration
 
     # ---------------- Inter-rep rest (UI only) ----------------
 
-    def show_inter_rep_rest(self):
-        """Show inter-repetition rest (UI only); skipped after last rep."""
+    def show_inter_rep_rest(self) -> int:
+        """Show inter-repetition rest (UI only); skipped after last rep.
+
+        Returns:
+            int: Phase duration in milliseconds.
+        """
         self.resting = True
         self.between_movements = False
 
         # Preview should show the SAME movement (next rep), no red border
         if self.current_index < len(self.preview_images):
             preview_path = self.preview_images[self.current_index]
-            if os.path.exists(preview_path):
-                self.preview_label.setPixmap(QPixmap(preview_path))
+            if preview_path in self._existing_paths:
+                self.preview_label.setPixmap(self._pixmap(preview_path, self.preview_label))
             else:
                 self.preview_label.setText("Preview not found")
-        self.preview_label.setStyleSheet("border: 0px;")
+        self._set_preview_highlight(False)
 
         # Show rest image in main area
-        if os.path.exists(rest_image_path):
-            self.gif_label.setPixmap(QPixmap(rest_image_path))
+        if rest_image_path in self._existing_paths:
+            self.gif_label.setPixmap(self._pixmap(rest_image_path, self.gif_label))
         else:
             self.gif_label.setText("Rest")
 
@@ -323,12 +449,7 @@ class GifExerciseViewer(QWidget):
         )
 
         self._phase_start(rest_between_repeats, color="red", time_label_prefix="Time")
-        # After inter-rep rest, increment repeat and start movement again
-        def _next_rep():
-            self.current_repeat += 1
-            self.start_movement()
-
-        QTimer.singleShot(rest_between_repeats, lambda: self._phase_finish(_next_rep))
+        return rest_between_repeats
 
     # ---------------- Session completion ----------------
 
@@ -336,18 +457,19 @@ class GifExerciseViewer(QWidget):
         """Finalize the practice session."""
         self.resting = True
         self.between_movements = False
-        self.preview_label.setStyleSheet("border: 0px;")
+        self._release_movie()
+        self._set_preview_highlight(False)
         self.status_label.setText("Session Complete")
         self.timer_label.setText("")
         self.gif_label.setText("All movements done")
-        self._radial_job_active = False
+        self.radial.stop()
         self.radial.update_value(0)
 
     # ---------------- (Legacy compatibility helpers if needed) ----------------
 
     def play_next(self):
         """Legacy entry point; kept only for compatibility (unused)."""
-        # Not used in the updated flow; real transitions use start_movement / show_pre_movement_rest / show_inter_rep_rest.
+        # Not used in the updated flow; real transitions are driven by `_advance` over `_schedule`.
         pass
 
 
@@ -7,21 +7,31 @@ movement/rest segments. Designed for synchronous EMG/EEG experiments with
 optional counter channels and HDF5/CSV persistence.
 """
 
-import gc
-import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 import os
 
 import numpy as np
 import time
 from util.channel_alignment import simple_alignment
-from util.OTB_refactored.configuration_processing import calculate_crc8, validate_config, process_config
+from util.OTB_refactored.configuration_processing import validate_config, process_config
 from util.file_pathing import save_channels, make_subject_directory
 from util.processing import process
 from util.socket_handling import SocketHandler
 from config import Config
 
 SAMPLE_TOLERANCE = 200
+# The stop command is a single all-zero control byte (no device enabled, acquisition off)
+STOP_COMMAND = bytes(1)
+
+
+def _report_save_error(future):
+    """Print a failure from the segment writer thread, which would otherwise be dropped silently."""
+    error = future.exception()
+    if error is not None:
+        print(f"Failed to save segment: {error!r}")
 
 class Session:
     """Manage a recording session for EMG/EEG data acquisition.
@@ -55,14 +65,32 @@ class Session:
         self.conf_string = None
         self.tot_num_byte = None
         self.tot_num_chan = None
+        # Set while no segment is being received; `recording` reads and writes it
+        self._idle = threading.Event()
+        # Held by whoever is reading the socket: a segment for its whole receive, a drain per read
+        self._socket_lock = threading.Lock()
         self.recording = False
         self.emg_channels = None
+        # Decode + save of finished segments runs here, in order, while the caller goes back to the socket
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="segment-writer")
         self.start()
         self.id = 0
         self.dateString = datetime.today().strftime('%d-%m')
         self.make_directory()
         self.ind = 0
 
+    @property
+    def recording(self):
+        """bool: True while a segment is being received (see `_receiving`)."""
+        return not self._idle.is_set()
+
+    @recording.setter
+    def recording(self, value):
+        if value:
+            self._idle.clear()
+        else:
+            self._idle.set()
+
     def start(self):
         """Validate and send the start/configuration command to the device.
 
@@ -81,7 +109,7 @@ class Session:
 
         # Send the configuration to syncstation
         start_command = self.conf_string[0:conf_str_len]
-        packed_data = struct.pack('B' * conf_str_len, *start_command)
+        packed_data = bytes(start_command)
         data_sent = self.socket_handler.send(packed_data)
         print(f"Start Command Sent: {start_command}")
 
@@ -90,18 +118,20 @@ class Session:
     def finish(self):
         """Send a stop command and close the socket.
 
-                Mutates the configuration header to craft a stop command, sends it,
-                and closes the TCP connection.
+                Waits for a segment still being received (so it is queued for
+                saving), sends the constant `STOP_COMMAND` byte, closes the TCP
+                connection, and blocks until every queued segment is saved;
+                `conf_string` is left as configured. Can block for up to a
+                segment plus its save, so UI code should call it off the UI thread.
                 """
+        # A segment in progress is queued before `_receiving` clears the flag
+        self._idle.wait()
         # Send the stop command to syncstation
-        for i in range(18):
-            self.conf_string[i] = 0
-        self.conf_string[1] = calculate_crc8(self.conf_string, 1)
-        stop_command = self.conf_string[0:1]
-        packed_data = struct.pack('B' * len(stop_command), *stop_command)
         print("Stop Command Sent")
-        data_sent = self.socket_handler.send(packed_data)
+        data_sent = self.socket_handler.send(STOP_COMMAND)
         self.socket_handler.close()
+        # Let queued segments reach disk before the process is allowed to exit
+        self._writer.shutdown(wait=True)
 
     def emg_recording(self, perform_time, rest_time, movement, rep):
         """Record one movement + following rest segment for EMG.
@@ -128,9 +158,12 @@ class Session:
     def record(self, is_movement, rest_time, movement, perform_time=0, rep=None):
         """Record a single segment (movement or rest), align, decode, and save.
 
-        Streams raw bytes for `rec_time`, aligns frames (EEG-aware if enabled),
-        reshapes to frames, decodes to channel arrays, builds movement/rest labels,
-        and saves EMG/EEG/counter channels according to config.
+        Streams raw bytes for `rec_time`, then hands the buffer to the session's
+        writer thread, which reshapes to frames, decodes to channel arrays, builds
+        movement/rest labels, and saves EMG/EEG/counter channels according to
+        config. Returns as soon as the bytes are received, so decoding and disk
+        writes overlap acquisition of the next segment; segments are still saved
+        one at a time in the order they were recorded.
 
         Args:
             is_movement (bool): If True, records `perform_time + rest_time`; else only rest.
@@ -146,27 +179,39 @@ class Session:
         if is_movement: rec_time = perform_time + rest_time
         else: rec_time = rest_time
 
+        # Queued inside `_receiving`, so finish() cannot close the writer between receive and submit
+        with self._receiving():
+            start_time = time.time()
+            data_buffer = self._receive_for(rec_time)
+            self.ind +=1
+            print(f"Elapsed time for receiving data: {time.time() - start_time:.2f} seconds")
+            print("Total bytes received:", len(data_buffer))
+            segment = (data_buffer, rec_time, is_movement, rest_time, movement, perform_time, rep)
+            try:
+                future = self._writer.submit(self._decode_and_save, *segment)
+            except RuntimeError:
+                # finish() has already shut the writer down; save here rather than drop the segment
+                self._decode_and_save(*segment)
+            else:
+                future.add_done_callback(_report_save_error)
+
+    def _decode_and_save(self, data_buffer, rec_time, is_movement, rest_time, movement, perform_time, rep):
+        """Trim, decode, label, and save one received segment (runs on the writer thread).
 
+        Args:
+            data_buffer (memoryview): Raw bytes received for the segment.
+            rec_time (float): Segment duration in seconds.
+            is_movement (bool): Whether the segment holds a movement plus its rest.
+            rest_time (float): Rest duration in seconds.
+            movement (int): Movement label/index.
+            perform_time (float): Movement duration in seconds.
+            rep (int | None): Repetition index for naming when `is_movement=True`.
+        """
         total_samples = int(self.config.SAMPLE_FREQUENCY * rec_time)
         expected_bytes = self.tot_num_byte * total_samples
-        data = np.zeros((self.tot_num_chan, int(self.config.SAMPLE_FREQUENCY * rec_time)))
 
         chan_ready = 0
-        data_buffer = b""  # Buffer to store the received data
-
-        chunk_size = self.tot_num_byte * 10
-        start_time = time.time()
-        self.recording = True
 
-        while time.time() - start_time < rec_time:
-            data_temp = self.socket_handler.receive(chunk_size)
-            if not data_temp:
-                break
-            data_buffer += data_temp
-        self.ind +=1
-        self.recording = False
-        print(f"Elapsed time for receiving data: {time.time() - start_time:.2f} seconds")
-        print("Total bytes received:", len(data_buffer))
         sample_size = self.tot_num_byte
         remainder = len(data_buffer) % sample_size
         if remainder != 0:
@@ -177,36 +222,92 @@ class Session:
             print("Warning: received less data than expected")
 
         temp_array = np.frombuffer(data_buffer, dtype=np.uint8)
-        temp = np.reshape(temp_array, (-1, self.tot_num_byte)).T  # dynamic reshape
+        temp = np.reshape(temp_array, (-1, self.tot_num_byte))  # dynamic reshape, (samples, bytes)
 
-        num_samples = temp.shape[1]
+        num_samples = temp.shape[0]
         expected_samples = self.config.SAMPLE_FREQUENCY * rec_time
 
+        num_columns = total_samples
         if num_samples != expected_samples and expected_samples - num_samples < SAMPLE_TOLERANCE:
-            data = np.zeros((self.tot_num_chan, num_samples))
+            num_columns = num_samples
             print(f"Allowed {num_samples} samples")
 
+        # process() writes every channel row, so the output needs no zero fill
+        data = np.empty((self.tot_num_chan, num_columns))
         data = process(self.config, temp, data, self.tot_num_byte, chan_ready)
 
-        labels = np.array([movement] * int(perform_time * self.config.SAMPLE_FREQUENCY) + [0] * int(rest_time * self.config.SAMPLE_FREQUENCY))
-        labels = labels if is_movement else np.array([0] * int(rest_time * self.config.SAMPLE_FREQUENCY))
+        # Movement ids (0-29) fit in int8, a quarter of the default int32/int64 footprint on disk and in memory
+        num_rest = int(rest_time * self.config.SAMPLE_FREQUENCY)
+        if is_movement:
+            num_move = int(perform_time * self.config.SAMPLE_FREQUENCY)
+            labels = np.empty(num_move + num_rest, dtype=np.int8)
+            labels[:num_move] = movement
+            labels[num_move:] = 0
+        else:
+            labels = np.zeros(num_rest, dtype=np.int8)
 
 
         suffix = f"M{movement}R{rep}" if is_movement else f"M{movement}rest"
         exercise_group = "EA" if movement < 13 else "EB"
 
         if self.config.USE_EMG:
-            self.save_channels(data[self.config.MUOVI_EMG_CHANNELS], labels, "emg", perform_time, exercise_group, suffix)
+            self.save_channels(data[self.config.MUOVI_EMG_SLICE], labels, "emg", perform_time, exercise_group, suffix)
 
         if self.config.USE_EEG:
-            self.save_channels(data[self.config.MUOVI_PLUS_EEG_CHANNELS], labels, "eeg", perform_time, exercise_group, suffix)
+            self.save_channels(data[self.config.MUOVI_PLUS_EEG_SLICE], labels, "eeg", perform_time, exercise_group, suffix)
 
         if self.config.SAVE_COUNTERS and self.config.USE_EEG:
             self.save_channels(np.array([data[self.config.SYNCSTATION_COUNTER_CHANNEL],
                                          data[self.config.MUOVI_PLUS_COUNTER_CHANNEL]]), labels, "counters", perform_time, exercise_group,
                                suffix)
 
-        gc.collect()
+    @contextmanager
+    def _receiving(self):
+        """Mark the session as recording and own the socket for the duration of the block.
+
+        `recording` is raised before the lock is taken, so a drain that holds
+        the lock for one read sees it and backs off instead of reading again.
+        """
+        self.recording = True
+        try:
+            with self._socket_lock:
+                yield
+        finally:
+            self.recording = False
+
+    def _receive_for(self, rec_time):
+        """Stream raw bytes for `rec_time` seconds into one preallocated buffer.
+
+        Callers hold `_receiving` around it, so `recording` covers the read.
+
+        Reads land directly in a `bytearray` sized for the expected frames (plus
+        one chunk of headroom) via `recv_into`, so the stream is copied once
+        instead of re-concatenating an immutable `bytes` on every chunk. The
+        buffer doubles in the rare case the device delivers more than expected.
+        Each read asks for up to 1000 frames (at least 64 KiB), so a segment
+        takes a handful of syscalls rather than one per 10 samples.
+
+        Args:
+            rec_time (float): Seconds to keep receiving.
+
+        Returns:
+            memoryview: Zero-copy view of the bytes received.
+        """
+        chunk_size = max(64 * 1024, self.tot_num_byte * 1000)
+        buffer = bytearray(self.tot_num_byte * int(self.config.SAMPLE_FREQUENCY * rec_time) + chunk_size)
+        received = 0
+        # Monotonic, so a wall-clock adjustment mid-segment cannot stretch or cut short the recording
+        deadline = time.monotonic() + rec_time
+
+        while time.monotonic() < deadline:
+            if received + chunk_size > len(buffer):
+                buffer.extend(bytes(len(buffer)))
+            num_bytes = self.socket_handler.receive_into(memoryview(buffer)[received:received + chunk_size])
+            if not num_bytes:
+                break
+            received += num_bytes
+        return memoryview(buffer)[:received]
+
     def receive_and_ignore(self, duration, no_print=False):
         """Passively read and discard incoming bytes for a duration.
 
@@ -219,12 +320,15 @@ class Session:
                 """
         if not no_print: print("Ignoring")
         end_time = time.time() + duration
-        while self.recording:
-            time.sleep(0.05)
+        # Drain in large reads; the stream runs at several hundred KB/s
+        scratch = bytearray(64 * 1024)
+        # Wakes the moment an in-progress segment finishes, rather than on a 50 ms poll
+        self._idle.wait()
         while time.time() < end_time:
-            if not self.recording:
-                data = self.socket_handler.receive(1024)
-                if not data:
+            with self._socket_lock:
+                # Re-checked under the lock after every read: a segment waiting for the socket
+                # gets it next, and no read of ours overlaps one of its reads
+                if self.recording or not self.socket_handler.receive_into(scratch):
                     break
 
     def set_id(self, new_id):
@@ -239,13 +343,9 @@ class Session:
         """Ensure the base data destination directory exists."""
         dir_path = self.config.DATA_DESTINATION_PATH
 
-        # Check if it exists and is a directory
-        if not os.path.isdir(dir_path):
-            # Create the directory (and any missing parent directories)
-            os.makedirs(dir_path)
-            print(f"Created directory: {dir_path}")
-        else:
-            print(f"Directory already exists: {dir_path}")
+        # Create the directory (and any missing parent directories); a no-op if it already exists
+        os.makedirs(dir_path, exist_ok=True)
+        print(f"Data directory ready: {dir_path}")
 
     def make_subject_directory(self, subject_id, exercise_set):
         """Create (if needed) the subject directory tree for an exercise set.
@@ -284,7 +384,8 @@ class Session:
             data,
             labels,
             save_h5=self.config.SAVE_H5,
-            date_str=self.dateString
+            date_str=self.dateString,
+            save_csv=self.config.SAVE_CSV
         )
 
     def get_record(self, rec_time):
@@ -299,35 +400,12 @@ class Session:
                Returns:
                    np.ndarray: Array of shape [n_channels, n_samples] for the captured segment.
                """
-
-        data_buffer = b""
-        chunk_size = self.tot_num_byte * 10
-        start_time = time.time()
-        self.recording = True
-
-        while time.time() - start_time < rec_time:
-            data_temp = self.socket_handler.receive(chunk_size)
-            if not data_temp:
-                break
-            data_buffer += data_temp
-
         total_samples = int(self.config.SAMPLE_FREQUENCY * rec_time)
         expected_bytes = self.tot_num_byte * total_samples
-        data = np.zeros((self.tot_num_chan, int(self.config.SAMPLE_FREQUENCY * rec_time)))
 
         chan_ready = 0
-        data_buffer = b""  # Buffer to store the received data
-
-        chunk_size = self.tot_num_byte * 10
-        start_time = time.time()
-        self.recording = True
-
-        while time.time() - start_time < rec_time:
-            data_temp = self.socket_handler.receive(chunk_size)
-            if not data_temp:
-                break
-            data_buffer += data_temp
-        self.recording = False
+        with self._receiving():
+            data_buffer = self._receive_for(rec_time)
         if not self.config.USE_EEG:
             offset = simple_alignment(data_buffer)
         else:
@@ -344,7 +422,7 @@ class Session:
             print("Warning: received less data than expected")
 
         temp_array = np.frombuffer(data_buffer, dtype=np.uint8)
-        temp = np.reshape(temp_array, (-1, self.tot_num_byte)).T  # dynamic reshape
-        data = np.zeros((self.tot_num_chan, temp.shape[1]))
+        temp = np.reshape(temp_array, (-1, self.tot_num_byte))  # dynamic reshape, (samples, bytes)
+        data = np.empty((self.tot_num_chan, temp.shape[0]))
         data = process(self.config, temp, data, self.tot_num_byte, chan_ready)
         return data
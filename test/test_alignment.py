@@ -134,7 +134,7 @@ def test_alignment(num, verbose=True, num_samples=default_num_samples, thresh_st
 
     # 3) process to channel x time
     temp_array = np.frombuffer(buffer, dtype=np.uint8)
-    temp = np.reshape(temp_array, (-1, tot_num_byte)).T
+    temp = np.reshape(temp_array, (-1, tot_num_byte))
     data = np.zeros((tot_num_chan, frames), dtype=np.float64)
     data = process(Config(False, True), temp, data, tot_num_byte, chan_ready=0)
 
@@ -0,0 +1,79 @@
+"""Tests for the `.npy` cache behind `util.file_pathing.load_csv`/`write_csv`."""
+
+import os
+
+import numpy as np
+
+import util.file_pathing as file_pathing
+from util.file_pathing import load_csv, write_csv
+
+
+def _caches(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith(".npy"))
+
+
+def test_cold_load_parses_and_writes_cache(tmp_path):
+    csv_path = tmp_path / "emg.csv"
+    data = np.arange(12, dtype=float).reshape(4, 3) - 5.5
+    np.savetxt(csv_path, data, delimiter=",")
+
+    first = load_csv(csv_path)
+    np.testing.assert_array_equal(first, data)
+    assert len(_caches(tmp_path)) == 1
+
+    second = load_csv(csv_path)
+    assert isinstance(second, np.memmap)
+    np.testing.assert_array_equal(second, data)
+
+
+def test_write_csv_round_trip_seeds_cache(tmp_path):
+    csv_path = tmp_path / "derived.csv"
+    data = np.random.default_rng(0).standard_normal((50, 4))
+
+    write_csv(csv_path, data)
+
+    assert len(_caches(tmp_path)) == 1
+    np.testing.assert_array_equal(load_csv(csv_path), data)
+    # The cache must agree with what parsing the text gives back
+    np.testing.assert_array_equal(np.loadtxt(csv_path, delimiter=","), data)
+
+
+def test_rewritten_csv_invalidates_cache(tmp_path):
+    csv_path = tmp_path / "emg.csv"
+    write_csv(csv_path, np.zeros((3, 2)))
+    old_cache = _caches(tmp_path)
+
+    np.savetxt(csv_path, np.ones((5, 2)), delimiter=",")
+    os.utime(csv_path, ns=(1, 1))  # guarantee a new key even on coarse mtime clocks
+
+    np.testing.assert_array_equal(load_csv(csv_path), np.ones((5, 2)))
+    new_cache = _caches(tmp_path)
+    assert len(new_cache) == 1 and new_cache != old_cache
+
+
+def test_stale_cache_cleanup_leaves_similar_names_alone(tmp_path):
+    names = ["rec1.csv", "rec[1].csv", "rec*?.csv"]
+    for name in names:
+        write_csv(tmp_path / name, np.eye(2))
+
+    np.savetxt(tmp_path / "rec[1].csv", np.eye(3), delimiter=",")
+    os.utime(tmp_path / "rec[1].csv", ns=(1, 1))
+    load_csv(tmp_path / "rec[1].csv")
+
+    caches = _caches(tmp_path)
+    assert len(caches) == 3
+    for name in names:
+        assert sum(cache.startswith(name + ".") for cache in caches) == 1
+
+
+def test_unwritable_cache_still_returns_data(tmp_path, monkeypatch):
+    csv_path = tmp_path / "emg.csv"
+    np.savetxt(csv_path, np.eye(3), delimiter=",")
+
+    def refuse(*args, **kwargs):
+        raise PermissionError("read-only")
+
+    monkeypatch.setattr(file_pathing.np, "save", refuse)
+
+    np.testing.assert_array_equal(load_csv(csv_path), np.eye(3))
+    assert _caches(tmp_path) == []
@@ -0,0 +1,33 @@
+"""Tests for `util.plotting.minmax_decimate`."""
+
+import numpy as np
+
+from util.plotting import minmax_decimate
+
+
+def test_short_signal_is_returned_unchanged():
+    signal = np.arange(10.0)
+    x, y = minmax_decimate(signal, target_len=20)
+    np.testing.assert_array_equal(x, np.arange(10))
+    assert y is signal
+
+
+def test_envelope_keeps_every_bucket_extreme():
+    signal = np.random.default_rng(0).standard_normal(10_007)
+    signal[1234] = 50.0    # isolated spikes must survive decimation
+    signal[9876] = -50.0
+    x, y = minmax_decimate(signal, target_len=400)
+
+    stride = -(-len(signal) // 200)
+    full = len(signal) // stride * stride
+    assert x.shape == y.shape
+    assert len(x) <= 400 + stride   # buckets plus a partial tail
+    assert np.all(np.diff(x) >= 0)
+    assert y.max() == signal.max() and y.min() == signal.min()
+
+    blocks = signal[:full].reshape(-1, stride)
+    np.testing.assert_array_equal(y[0:2 * len(blocks):2], blocks.min(axis=1))
+    np.testing.assert_array_equal(y[1:2 * len(blocks):2], blocks.max(axis=1))
+    # The tail that does not fill a bucket is kept sample for sample
+    np.testing.assert_array_equal(y[2 * len(blocks):], signal[full:])
+    np.testing.assert_array_equal(x[2 * len(blocks):], np.arange(full, len(signal)))
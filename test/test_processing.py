@@ -0,0 +1,108 @@
+"""Decoder tests for `util.processing.process`.
+
+Frames are built byte by byte from known sample values (including the
+16-bit and 24-bit extremes), then `process` is compared with a plain
+per-sample `int.from_bytes` reference decode of the same frames.
+"""
+
+import numpy as np
+import pytest
+
+from config import Config
+from util.OTB_refactored.configuration_processing import process_config
+from util.filters import preprocess_eeg
+from util.processing import process
+
+NUM_SAMPLES = 400
+
+# Two's complement edge cases first, then random fill
+EDGES_16 = [-32768, -32767, -256, -1, 0, 1, 255, 32767]
+EDGES_24 = [-8388608, -8388607, -65536, -1, 0, 1, 65535, 8388607]
+
+
+def _layout(config):
+    """Return the frame layout as (byte_width, signed, scale, filtered) per output channel."""
+    emg_scale = config.GAIN_RATIOS[config.EMG_MODE] * 1e3
+    eeg_scale = config.GAIN_RATIOS[config.EEG_MODE] * 1e3
+    layout = []
+    for dev_id in range(16):
+        if config.DEVICE_EN[dev_id] == 1:
+            if config.EMG[dev_id] == 1:
+                layout += [(2, True, emg_scale, False)] * 32 + [(2, False, 1.0, False)] * 6
+            else:
+                layout += [(3, True, eeg_scale, True)] * 64 + [(3, False, 1.0, False)] * 6
+    layout += [(2, False, 1.0, False)] * 6  # SyncStation channels
+    return layout
+
+
+def _make_frames(layout, rng):
+    """Encode random big-endian samples (edge values first) into raw frames."""
+    values = np.empty((len(layout), NUM_SAMPLES), dtype=np.int64)
+    for ch, (width, signed, _, _) in enumerate(layout):
+        bits = 8 * width
+        lo, hi = (-(1 << bits - 1), 1 << bits - 1) if signed else (0, 1 << bits)
+        edges = (EDGES_16 if width == 2 else EDGES_24) if signed else [0, 1, hi - 2, hi - 1]
+        values[ch] = rng.integers(lo, hi, NUM_SAMPLES)
+        values[ch, :len(edges)] = edges
+
+    frames = bytearray()
+    for s in range(NUM_SAMPLES):
+        for ch, (width, signed, _, _) in enumerate(layout):
+            frames += int(values[ch, s]).to_bytes(width, "big", signed=signed)
+    return bytes(frames), values
+
+
+def _reference_decode(frames, layout, tot_num_byte):
+    """Decode frames one sample at a time with `int.from_bytes`, then scale/filter like `process`."""
+    raw = np.empty((len(layout), NUM_SAMPLES))
+    for s in range(NUM_SAMPLES):
+        offset = s * tot_num_byte
+        for ch, (width, signed, _, _) in enumerate(layout):
+            raw[ch, s] = int.from_bytes(frames[offset:offset + width], "big", signed=signed)
+            offset += width
+
+    expected = raw.copy()
+    filtered = [ch for ch, (_, _, _, f) in enumerate(layout) if f]
+    if filtered:
+        expected[filtered] = preprocess_eeg(raw[filtered])
+    expected *= np.array([scale for _, _, scale, _ in layout])[:, None]
+    return raw, expected
+
+
+@pytest.mark.parametrize("use_emg, use_eeg", [(True, False), (False, True), (True, True)])
+def test_process_matches_reference_decode(use_emg, use_eeg):
+    config = Config(use_emg, use_eeg)
+    _, _, _, tot_num_chan, tot_num_byte, _ = process_config(
+        config.DEVICE_EN, config.EMG, config.MODE, config.NUM_CHAN)
+    layout = _layout(config)
+    assert len(layout) == tot_num_chan
+    assert sum(width for width, *_ in layout) == tot_num_byte
+
+    frames, values = _make_frames(layout, np.random.default_rng(0))
+    raw, expected = _reference_decode(frames, layout, tot_num_byte)
+    # The reference decode must reproduce the encoded values exactly
+    np.testing.assert_array_equal(raw, values)
+
+    temp = np.frombuffer(frames, dtype=np.uint8).reshape(-1, tot_num_byte)
+    data = process(config, temp, np.empty((tot_num_chan, NUM_SAMPLES)), tot_num_byte, 0)
+
+    np.testing.assert_allclose(data, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_process_signed_extremes_emg():
+    """Negative 16-bit samples come out negative, unsigned aux channels do not."""
+    config = Config(True, False)
+    _, _, _, tot_num_chan, tot_num_byte, _ = process_config(
+        config.DEVICE_EN, config.EMG, config.MODE, config.NUM_CHAN)
+    frame = bytearray(tot_num_byte)
+    frame[0:2] = (-32768).to_bytes(2, "big", signed=True)   # EMG channel 0
+    frame[2:4] = (-1).to_bytes(2, "big", signed=True)       # EMG channel 1
+    frame[64:66] = b"\xff\xff"                              # first Muovi aux channel
+    temp = np.frombuffer(bytes(frame), dtype=np.uint8).reshape(1, tot_num_byte)
+
+    data = process(config, temp, np.empty((tot_num_chan, 1)), tot_num_byte, 0)
+
+    scale = config.GAIN_RATIOS[config.EMG_MODE] * 1e3
+    assert data[0, 0] == pytest.approx(-32768 * scale)
+    assert data[1, 0] == pytest.approx(-1 * scale)
+    assert data[32, 0] == 65535
@@ -84,6 +84,7 @@ class ExerciseApp:
         total_ms (int): Total milliseconds of the current phase.
         phase_callback (callable | None): Callback invoked at end of a phase.
         _countdown_job (str | None): Tk `after` job id for the countdown loop.
+        _photo_cache (dict[tuple, ImageTk.PhotoImage]): Scaled images keyed by (path, max_w, max_h).
         recorder (Session | None): Recorder instance (created after device confirmation).
 
         device_frame (tk.Frame): Device selection frame.
@@ -143,6 +144,9 @@ class ExerciseApp:
         self.phase_callback = None
         self._countdown_job = None
 
+        # Scaled images are decoded and resized once, then reused every phase
+        self._photo_cache = {}
+
         # Recorder instance (set after device confirmation)
         self.recorder = None
 
@@ -430,17 +434,35 @@ class ExerciseApp:
                 f"Rest Time : {self.rest_time*1000:.0f} ms\n"
                 f"Repeats: {self.num_repeats}")
 
+    def _scaled_photo(self, path, max_w, max_h):
+        """Return a cached Tk image of `path` thumbnailed to fit (max_w, max_h).
+
+        Args:
+            path (str): Filesystem path to the image.
+            max_w (float): Maximum width in pixels.
+            max_h (float): Maximum height in pixels.
+
+        Returns:
+            ImageTk.PhotoImage: The scaled image.
+        """
+        key = (path, max_w, max_h)
+        tkimg = self._photo_cache.get(key)
+        if tkimg is None:
+            img = Image.open(path)
+            img.thumbnail((max_w, max_h), Image.LANCZOS)
+            tkimg = ImageTk.PhotoImage(img)
+            self._photo_cache[key] = tkimg
+        return tkimg
+
     def show_image(self, path):
         """Display the main (current) image scaled to fit the right panel.
 
         Args:
             path (str): Filesystem path to the image to display.
         """
-        img = Image.open(path)
         max_w = WINDOW_WIDTH * 0.7 * 1.3
         max_h = WINDOW_HEIGHT // 2.3 * 1.3
-        img.thumbnail((max_w, max_h), Image.LANCZOS)
-        tkimg = ImageTk.PhotoImage(img)
+        tkimg = self._scaled_photo(path, max_w, max_h)
         self.image_label.config(image=tkimg)
         self.image_label.image = tkimg
 
@@ -450,11 +472,9 @@ class ExerciseApp:
         Args:
             path (str): Filesystem path to the image to preview.
         """
-        img = Image.open(path)
         max_w = WINDOW_WIDTH * 0.7 // 1.5 * 1.2
         max_h = WINDOW_HEIGHT // 2.3 // 1.5 * 1.2
-        img.thumbnail((max_w, max_h), Image.LANCZOS)
-        tkimg = ImageTk.PhotoImage(img)
+        tkimg = self._scaled_photo(path, max_w, max_h)
         self.next_image_label.config(image=tkimg)
         self.next_image_label.image = tkimg
 
@@ -609,12 +629,7 @@ class ExerciseApp:
             color (str): Outline color for the radial arc (e.g., "red" for rest, "green" for movement).
         """
         # Cancel any prior countdown to avoid overlap
-        if self._countdown_job is not None:
-            try:
-                self.root.after_cancel(self._countdown_job)
-            except Exception:
-                pass
-            self._countdown_job = None
+        self._cancel_countdown()
 
         # Reset arc and apply requested color
         self.canvas.itemconfigure(self.arc, extent=0, outline=color)
@@ -628,11 +643,20 @@ class ExerciseApp:
         # Kick off the countdown loop using monotonic timing (arc animation only)
         self._arc_countdown(self.remaining_ms, self.total_ms, start_time=0)
 
+    def _cancel_countdown(self):
+        """Cancel the pending countdown tick, if any."""
+        if self._countdown_job is not None:
+            try:
+                self.root.after_cancel(self._countdown_job)
+            except Exception:
+                pass
+            self._countdown_job = None
+
     def _arc_countdown(self, remaining_ms, total_ms, start_time=0):
         """Internal countdown loop that animates the radial arc.
 
-        Uses monotonic time to compute elapsed and remaining duration. While
-        paused, the arc animation is effectively frozen.
+        Uses monotonic time to compute elapsed and remaining duration. Pausing
+        stops the loop; `resume_exercise` restarts the phase via `run_cycle`.
 
         Args:
             remaining_ms (int): Remaining milliseconds from the previous tick.
@@ -642,10 +666,9 @@ class ExerciseApp:
         if start_time == 0:
             start_time = _now()
 
-        # If paused, freeze the arc by adjusting a "virtual" start
+        # If paused, stop ticking; resuming restarts the phase from scratch
         if self.paused:
-            frozen_start = _now() - (total_ms - remaining_ms) / 1000.0
-            self._countdown_job = self.root.after(80, self._arc_countdown, remaining_ms, total_ms, frozen_start)
+            self._countdown_job = None
             return
 
         elapsed_ms = int((_now() - start_time) * 1000)
@@ -680,6 +703,7 @@ class ExerciseApp:
         self.paused = True
         self.current_repeat = 0
         self.after_last_repeat = False
+        self._cancel_countdown()
 
         self.show_image(rest_image)
         # Keep preview and remove any red border when pausing
@@ -740,10 +764,11 @@ class ExerciseApp:
     def stop_session(self):
         """Immediately stop the recording session and close the UI.
 
-        Calls `recorder.finish()` and destroys the root window.
+        Starts `recorder.finish()` on its own thread and destroys the root window;
+        the interpreter waits for that thread, so queued segments still get saved.
         """
         try:
-            self.recorder.finish()
+            self._finish_recorder()
         finally:
             self.root.destroy()
 
@@ -754,7 +779,7 @@ class ExerciseApp:
         the Pause button into a Close action.
         """
         try:
-            self.recorder.finish()
+            self._finish_recorder()
         finally:
             self.index_label.config(text="Session Complete")
             self.time_label.config(text="")
@@ -768,6 +793,14 @@ class ExerciseApp:
 
     # ---------------- Recording hooks ----------------
 
+    def _finish_recorder(self):
+        """Run `recorder.finish()` without blocking the Tk event loop.
+
+        `finish` waits for an in-progress segment and for queued saves. The
+        thread is non-daemon so the process does not exit before it is done.
+        """
+        threading.Thread(target=self.recorder.finish, name="recorder-finish").start()
+
     def record_emg(self):
         """Spawned worker that records one movement repetition.
 
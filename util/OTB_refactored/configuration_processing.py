@@ -3,6 +3,9 @@
 import os
 import re
 
+# Movement number in movement image filenames, e.g. "Index_flexion_M1.png"
+MOVEMENT_NUMBER_PATTERN = re.compile(r'M(\d+)\.png', re.IGNORECASE)
+
 
 def calculate_crc8(vector, length):
     """Function to calculate CRC8"""
@@ -155,5 +158,5 @@ def get_sorted_file_paths(folder_path: str) -> list:
                 file_paths.append( file)
 
     # Sort files by the 'M' number in the filename
-    file_paths.sort(key=lambda x: int(re.search(r'M(\d+)\.png', x, re.IGNORECASE).group(1)))
+    file_paths.sort(key=lambda x: int(MOVEMENT_NUMBER_PATTERN.search(x).group(1)))
     return file_paths
\ No newline at end of file
@@ -34,34 +34,14 @@ def simple_alignment(data_buffer):
     data = np.zeros((45, 10))
 
     temp_array = np.frombuffer(samples, dtype=np.uint8)
-    temp = np.reshape(temp_array, (-1, 88)).T  # dynamic reshape
-    # Processing data
+    temp = np.reshape(temp_array, (-1, 88))  # dynamic reshape, (samples, bytes)
+    # Signed big-endian 16-bit views: the 38 Muovi channels, then the 6 trailing
+    # auxiliary channels (both sign-extended here, as the counter check expects)
     chan_ready = 1
-    for DevId in range(16):
-        if DevId == 0:
-            ch_ind = np.arange(0, 38 * 2, 2)
-            data_sub_matrix = temp[ch_ind].astype(np.int32) * 256 + temp[ch_ind + 1].astype(np.int32)
-
-            # Search for the negative values and make the two's complement
-            ind = np.where(data_sub_matrix >= 32768)
-            data_sub_matrix[ind] = data_sub_matrix[ind] - 65536
-
-            data[chan_ready:chan_ready + 38, :] = data_sub_matrix
-
-
-            del ch_ind
-            del ind
-            del data_sub_matrix
-            chan_ready += 38
+    data[chan_ready:chan_ready + 38, :] = temp[:, 0:38 * 2].view(">i2").T
+    chan_ready += 38
     aux_starting_byte = 88 - (6 * 2)
-    ch_ind = np.arange(aux_starting_byte, aux_starting_byte + 12, 2)
-    data_sub_matrix = temp[ch_ind].astype(np.int32) * 256 + temp[ch_ind + 1].astype(np.int32)
-
-    # Search for the negative values and make the two's complement
-    ind = np.where(data_sub_matrix >= 32768)
-    data_sub_matrix[ind] = data_sub_matrix[ind] - 65536
-
-    data[chan_ready:chan_ready + 6, :] = data_sub_matrix
+    data[chan_ready:chan_ready + 6, :] = temp[:, aux_starting_byte:88].view(">i2").T
     for i, D in enumerate(data):
         if D[0] == D[1] - 1 and D[1] == D[2] - 1:
             plus6 = data[(i+6)%44]
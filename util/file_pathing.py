@@ -4,16 +4,44 @@ This module provides functions to:
 - Create subject-specific directory structures for storing recordings.
 - Save channel data and labels into both CSV and HDF5 formats,
   organized by subject, data type, and exercise set.
+- Load saved CSV recordings, caching the parsed array as a sibling `.npy`
+  keyed by the CSV's modification time and size.
+- Write derived CSVs with that cache already in place, so reading them back
+  never re-parses the text.
 
 Directories are created automatically if they do not already exist.
 """
 
+import glob
 from pathlib import Path
 import os
 import numpy as np
 import h5py
 from datetime import datetime
 
+# HDF5 datasets are stored in chunks of one second of samples (at the 2 kHz
+# stream rate) across all channels, gzip-compressed at level 1: the fastest
+# setting of the standard deflate filter, so any HDF5 reader (MATLAB, h5py,
+# HDFView) can open the files without extra plugins. The byte shuffle filter
+# is left off; on millivolt float64 samples it compresses worse, not better.
+H5_CHUNK_SAMPLES = 2000
+H5_COMPRESSION = dict(compression="gzip", compression_opts=1)
+# Per-type HDF5 sample dtype. EMG rows are 16-bit device counts times a gain
+# factor, so float32's 24-bit mantissa keeps every distinct count distinct at
+# half the bytes. EEG is stored after filtering (continuous values) and stays
+# float64, as do any types not listed here.
+H5_DATA_DTYPES = {"emg": np.float32}
+
+# Directories already created (or found) by this process; see `_ensure_dir`
+_ready_dirs = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create `path` (and parents) once per process; later calls are a set lookup."""
+    if path not in _ready_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ready_dirs.add(path)
+
 
 def make_subject_directory(base_path, subject_id, exercise_set,
                            use_emg: bool = True,
@@ -66,7 +94,8 @@ def make_subject_directory(base_path, subject_id, exercise_set,
 
 
 def save_channels(base_path, subject_id, type_string, group, perform_time,
-                  suffix, data, labels, save_h5: bool = True, date_str: str = None) -> None:
+                  suffix, data, labels, save_h5: bool = True, date_str: str = None,
+                  save_csv: bool = True) -> None:
     """Save EMG/EEG/counter channel data and labels to disk.
 
     Args:
@@ -80,10 +109,15 @@ def save_channels(base_path, subject_id, type_string, group, perform_time,
         labels (np.ndarray): 2D array of corresponding labels.
         save_h5 (bool, optional): If True, also save HDF5 file. Defaults to True.
         date_str (str, optional): Date string for filenames. If None, uses today’s date (dd-mm).
+        save_csv (bool, optional): If True, save CSV files. Defaults to True. Formatting
+            every sample as text is the slowest part of saving, so HDF5-only sessions
+            can turn this off.
 
     Saves:
-        - CSV files for data and labels.
-        - Optional HDF5 file with datasets "<type>_data" and "<type>_label".
+        - Optional CSV files for data and labels.
+        - Optional HDF5 file with datasets "<type>_data" and "<type>_label",
+          chunked and compressed with `H5_COMPRESSION`; data is stored with
+          the dtype from `H5_DATA_DTYPES` (float64 otherwise).
 
     Filenames include the date, perform time in ms, and provided suffix.
     """
@@ -92,17 +126,97 @@ def save_channels(base_path, subject_id, type_string, group, perform_time,
     stem = f"{type_string}_data_{date_str}_{perform_ms}ms_{suffix}"
 
     root = Path(base_path) / str(subject_id) / type_string / group
-    root.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(root)
 
     csv_data = root / "csv" / f"{stem}.csv"
     csv_label = root / "csv" / f"{type_string}_label_{date_str}_{perform_ms}ms_{suffix}.csv"
     h5_path = root / "hdf5" / f"{stem}.h5"
 
-    np.savetxt(csv_data, data.T, delimiter=",")
-    np.savetxt(csv_label, labels.T, delimiter=",")
+    # Both writers store samples as rows; transpose into one contiguous buffer so
+    # they read it sequentially instead of each striding across channels.
+    samples = np.ascontiguousarray(data.T)
+
+    if save_csv:
+        np.savetxt(csv_data, samples, delimiter=",")
+        np.savetxt(csv_label, labels.T, delimiter=",", fmt="%d")  # labels are integer movement ids
 
     if save_h5:
-        h5_path.parent.mkdir(parents=True, exist_ok=True)
+        h5_dtype = H5_DATA_DTYPES.get(type_string, np.float64)
+        _ensure_dir(h5_path.parent)
         with h5py.File(h5_path, "w") as hf:
-            hf.create_dataset(f"{type_string}_data", data=data.T)
-            hf.create_dataset(f"{type_string}_label", data=labels)
+            if samples.size:
+                hf.create_dataset(f"{type_string}_data", data=samples, dtype=h5_dtype,
+                                  chunks=(min(H5_CHUNK_SAMPLES, samples.shape[0]), samples.shape[1]),
+                                  **H5_COMPRESSION)
+                hf.create_dataset(f"{type_string}_label", data=labels, **H5_COMPRESSION)
+            else:  # filters need a non-empty chunk shape
+                hf.create_dataset(f"{type_string}_data", data=samples, dtype=h5_dtype)
+                hf.create_dataset(f"{type_string}_label", data=labels)
+
+
+def load_csv(path) -> np.ndarray:
+    """Load a comma-separated recording, reusing a cached `.npy` when possible.
+
+    The first load parses the CSV and writes the array next to it as
+    `<name>.csv.<key>.npy`, where the key encodes the CSV's modification time
+    and size; later loads memory-map that file instead of re-parsing the text.
+    Editing or rewriting the CSV changes the key, and the stale cache is
+    removed when the new one is written. The first load still pays for a
+    full text parse: `np.loadtxt` (a C parser since NumPy 1.23) is used as it
+    outpaces `np.genfromtxt` and `np.fromstring` on these files. If the cache
+    cannot be written (read-only or shared directory) the parsed array is
+    returned uncached.
+
+    Args:
+        path (str or Path): Path to the CSV file.
+
+    Returns:
+        np.ndarray: Array shaped as stored in the file (samples x channels).
+        Cached loads are read-only memory maps.
+    """
+    csv_path = Path(path)
+    npy_path = _csv_cache_path(csv_path)
+
+    if npy_path.exists():
+        return np.load(npy_path, mmap_mode="r")
+
+    data = np.loadtxt(csv_path, delimiter=",")
+    _write_csv_cache(csv_path, npy_path, data)
+    return data
+
+
+def write_csv(path, data: np.ndarray):
+    """Write `data` as a comma-separated file and seed its `load_csv` cache.
+
+    The CSV is written with `np.savetxt`'s default full-precision format, so
+    parsing it would give back exactly `data` as float64; that array is saved
+    as the cache directly and a later `load_csv` skips the text parse.
+
+    Args:
+        path (str or Path): Destination CSV path.
+        data (np.ndarray): 1D or 2D array (samples x channels).
+    """
+    csv_path = Path(path)
+    data = np.asarray(data, dtype=np.float64)
+    np.savetxt(csv_path, data, delimiter=",")
+    _write_csv_cache(csv_path, _csv_cache_path(csv_path), data)
+
+
+def _csv_cache_path(csv_path: Path) -> Path:
+    """Return the `.npy` cache path for the CSV's current mtime and size."""
+    stat = csv_path.stat()
+    return csv_path.with_name(f"{csv_path.name}.{stat.st_mtime_ns:x}-{stat.st_size:x}.npy")
+
+
+def _write_csv_cache(csv_path: Path, npy_path: Path, data: np.ndarray):
+    """Replace any cached arrays for `csv_path` with `data` at `npy_path`.
+
+    Filesystem errors are swallowed: the cache is only an optimisation, so an
+    unwritable directory just means the next load parses the CSV again.
+    """
+    try:
+        for stale in csv_path.parent.glob(f"{glob.escape(csv_path.name)}.*.npy"):
+            stale.unlink()
+        np.save(npy_path, data)
+    except OSError:
+        pass
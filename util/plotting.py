@@ -0,0 +1,41 @@
+"""Plotting helpers shared by the CSV viewer and the debug scripts.
+
+Keeps long recordings cheap to draw by reducing each trace to roughly screen
+resolution before it reaches matplotlib.
+"""
+
+import numpy as np
+
+MAX_PLOT_POINTS = 4000                  # Points drawn per trace; longer signals are min/max decimated
+
+
+def minmax_decimate(signal, target_len=MAX_PLOT_POINTS):
+    """Reduce a 1D signal to its per-bucket min/max envelope for plotting.
+
+    Splits the signal into about `target_len / 2` equal buckets and keeps the
+    minimum and maximum of each, so peaks stay visible while the number of
+    drawn points stays near screen resolution. Short signals are returned as-is.
+
+    Args:
+        signal (np.ndarray): 1D array of samples.
+        target_len (int, optional): Approximate number of output points.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Sample indices (x) and values (y) to plot.
+    """
+    n = signal.shape[0]
+    if n <= target_len:
+        return np.arange(n), signal
+
+    stride = -(-n // (target_len // 2))   # ceil division
+    full = n // stride * stride
+    blocks = np.asarray(signal[:full]).reshape(-1, stride)
+
+    x = np.repeat(np.arange(0, full, stride), 2)
+    y = np.empty(x.shape[0], dtype=blocks.dtype)
+    y[0::2] = blocks.min(axis=1)
+    y[1::2] = blocks.max(axis=1)
+    if full < n:
+        x = np.concatenate((x, np.arange(full, n)))
+        y = np.concatenate((y, signal[full:]))
+    return x, y
@@ -11,13 +11,37 @@ from config import Config
 from util.filters import preprocess_eeg
 
 
+def _unpack_24bit(temp, start, count, signed):
+    """Decode `count` consecutive big-endian 24-bit channels starting at byte `start`.
+
+    Each channel is read as an overlapping 4-byte big-endian word straight
+    from the frame buffer (stride 3 within a frame, no gather copies), then
+    shifted right by 8 to drop the trailing byte; on the signed word the
+    arithmetic shift also sign-extends, so the whole decode is one pass.
+
+    Args:
+        temp (np.ndarray): 2D uint8 frames, shaped (num_samples, tot_num_byte).
+        start (int): Byte offset of the first channel within a frame.
+        count (int): Number of 3-byte channels to decode.
+        signed (bool): Whether samples are two's complement.
+
+    Returns:
+        np.ndarray: int32 array shaped (num_samples, count).
+    """
+    frames = np.ascontiguousarray(temp)
+    words = np.ndarray((frames.shape[0], count), dtype=">i4" if signed else ">u4", buffer=frames,
+                       offset=start, strides=(frames.strides[0], 3))
+    return (words >> 8).astype(np.int32, copy=False)
+
+
 def process(config, temp, data, tot_num_byte, chan_ready):
     """Decode and process raw EMG/EEG bytes into channel data.
 
     Args:
         config (Config): Configuration object containing channel maps,
             gain ratios, device enables, and mode flags.
-        temp (np.ndarray): 1D array of raw byte values for one frame.
+        temp (np.ndarray): 2D uint8 array of raw frames, shaped
+            (num_samples, tot_num_byte) as received (no transpose).
         data (np.ndarray): Output 2D array where processed channel
             values are written.
         tot_num_byte (int): Total number of bytes expected in the frame.
@@ -34,65 +58,46 @@ def process(config, temp, data, tot_num_byte, chan_ready):
         - EEG channels are filtered with a 0.3–70 Hz bandpass and
           50 Hz notch filter via `preprocess_eeg`.
         - Both EMG and EEG signals are converted to millivolts.
+        - Bytes are gathered along the contiguous last axis of `temp`;
+          results are transposed only when written into `data`.
     """
 
+    # Millivolt scale factors, applied while storing into `data`
+    emg_scale = config.GAIN_RATIOS[config.EMG_MODE] * 1e3
+    eeg_scale = config.GAIN_RATIOS[config.EEG_MODE] * 1e3
+
     # Processing data
     for DevId in range(16):
         if config.DEVICE_EN[DevId] == 1:
             if config.EMG[DevId] == 1:
                 # EMG CASE
-                ch_ind = np.arange(0, 32 * 2, 2)
-                ch_ind_aux = np.arange(32 * 2, 38 * 2, 2)
-                data_sub_matrix = temp[ch_ind].astype(np.int32) * 256 + temp[ch_ind + 1].astype(np.int32)
-                data_sub_matrix_aux = temp[ch_ind_aux].astype(np.int32) * 256 + temp[ch_ind_aux + 1].astype(np.int32)
-
-                # Search for the negative values and make the two's complement (not on aux)
-                ind = np.where(data_sub_matrix >= 32768)
-                data_sub_matrix[ind] = data_sub_matrix[ind] - 65536
+                # Big-endian 16-bit views: signed for EMG (two's complement for free), unsigned for aux
+                data_sub_matrix = temp[:, 0:32 * 2].view(">i2")
+                data_sub_matrix_aux = temp[:, 32 * 2:38 * 2].view(">u2")
 
-                # converting raw volts to mV using the ratios from the documentation
-                data_sub_matrix = data_sub_matrix * config.GAIN_RATIOS[config.EMG_MODE] * 1e3
-
-                data[chan_ready:chan_ready + 32, :] = data_sub_matrix
-                data[chan_ready + 32:chan_ready + 38, :] = data_sub_matrix_aux
+                # converting raw volts to mV using the ratios from the documentation, written straight into data
+                np.multiply(data_sub_matrix.T, emg_scale, out=data[chan_ready:chan_ready + 32, :])
+                data[chan_ready + 32:chan_ready + 38, :] = data_sub_matrix_aux.T
 
             else:
                 # EEG CASE
                 start = config.MUOVI_PLUS_EEG_CHANNELS[0] * 2
-                ch_ind = np.arange(start, start + 64 * 3, 3)
-                ch_ind_aux = np.arange(start + 64 * 3, start + 64 * 3 + 6 * 3, 3)
-                data_sub_matrix = temp[ch_ind].astype(np.int32) * 65536 + temp[ch_ind + 1].astype(np.int32) * 256 + \
-                                  temp[ch_ind + 2].astype(np.int32)
-
-                data_sub_matrix_aux = temp[ch_ind_aux].astype(np.int32) * 65536 + temp[ch_ind_aux + 1].astype(np.int32) * 256 + \
-                                  temp[ch_ind_aux + 2].astype(np.int32)
-
-                # Search for the negative values and make the two's complement
-                ind = np.where(data_sub_matrix >= 8388608)
-                data_sub_matrix[ind] = data_sub_matrix[ind] - 16777216
+                # 24-bit samples: signed EEG, unsigned aux, each decoded in a single pass
+                data_sub_matrix = _unpack_24bit(temp, start, 64, signed=True)
+                data_sub_matrix_aux = _unpack_24bit(temp, start + 64 * 3, 6, signed=False)
 
                 #Apply the filtering pipeline (Bandpass 0.3Hz-70Hz and Bandstop to remove line noise at 50Hz)
-                data_sub_matrix = preprocess_eeg(data_sub_matrix)
-
-                # converting raw volts to mV using the ratios from the documentation
-                data_sub_matrix = data_sub_matrix * config.GAIN_RATIOS[config.EEG_MODE] * 1e3
+                data_sub_matrix = preprocess_eeg(data_sub_matrix.T)
 
+                # converting raw volts to mV using the ratios from the documentation, written straight into data
+                np.multiply(data_sub_matrix, eeg_scale, out=data[chan_ready:chan_ready + 64, :])
+                data[chan_ready + 64:chan_ready + 70, :] = data_sub_matrix_aux.T
 
-                data[chan_ready:chan_ready + 64, :] = data_sub_matrix
-                data[chan_ready + 64:chan_ready + 70, :] = data_sub_matrix_aux
-
-            del ch_ind
-            del ind
             del data_sub_matrix
             chan_ready += config.NUM_CHAN[DevId]
 
     aux_starting_byte = tot_num_byte - (6 * 2)
-    ch_ind = np.arange(aux_starting_byte, aux_starting_byte + 12, 2)
-    data_sub_matrix = temp[ch_ind].astype(np.int32) * 256 + temp[ch_ind + 1].astype(np.int32)
-    # Search for the negative values and make the two's complement
-    # ind = np.where(data_sub_matrix >= 32768)
-    # data_sub_matrix[ind] = data_sub_matrix[ind] - 65536
-    data[chan_ready:chan_ready + 6, :] = data_sub_matrix
-    del data_sub_matrix
-
-    return data
\ No newline at end of file
+    # Unsigned big-endian 16-bit view (no two's complement on the SyncStation channels)
+    data[chan_ready:chan_ready + 6, :] = temp[:, aux_starting_byte:aux_starting_byte + 12].view(">u2").T
+
+    return data
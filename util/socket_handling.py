@@ -9,6 +9,11 @@ like flushing the socket buffer.
 import socket
 import time
 
+# Kernel receive buffer requested for the stream socket. Large enough to hold
+# several seconds of a full SyncStation stream, so the device is never
+# throttled while the reader is between `recv` calls.
+RECEIVE_BUFFER_SIZE = 4 * 1024 * 1024
+
 
 class SocketHandler:
     """Lightweight wrapper around a TCP socket connection."""
@@ -46,6 +51,8 @@ class SocketHandler:
             try:
                 self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                # Set before connecting so the TCP window scale is negotiated for it
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECEIVE_BUFFER_SIZE)
                 self.socket.connect((self.ip, self.port))
                 print("Connected to Socket!")
                 self.socket.settimeout(20)
@@ -104,6 +111,23 @@ class SocketHandler:
             print(msg)
             return None
 
+    def receive_into(self, buffer) -> int:
+        """Receive data directly into a caller-owned writable buffer.
+
+        Args:
+            buffer (bytearray | memoryview): Writable buffer; at most
+                `len(buffer)` bytes are read into its start.
+
+        Returns:
+            int: Number of bytes received, or 0 if the connection closed or an
+                error occurred.
+        """
+        try:
+            return self.socket.recv_into(buffer)
+        except socket.error as msg:
+            print(msg)
+            return 0
+
     def flush(self):
         """Flush any residual data in the socket buffer.
 
@@ -12,6 +12,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib
 from config import Config
+from util.file_pathing import load_csv
+from util.plotting import minmax_decimate
 matplotlib.use('TkAgg')
 
 
@@ -34,6 +36,9 @@ MICRO_VOLTS = False
 if FILENAME.split("\\")[-1].startswith("eeg"):
     MICRO_VOLTS = True
 
+FIGURE_NAME = "view_csv"                # Plots reuse this one figure window instead of opening new ones
+
+
 def plot_file(file_path, channel_list=[]):
     """Plot multiple channels from a CSV signal file in stacked subplots.
 
@@ -55,7 +60,7 @@ Notes:
 """
 
 
-    data = np.loadtxt(file_path, delimiter=',')
+    data = load_csv(file_path)
     data = data.transpose()
     if len(channel_list) > 0:
         data = data[channel_list]
@@ -68,8 +73,10 @@ Notes:
     print(data.shape)
 
 
-    plt.clf()
-    fig, axes = plt.subplots(nrows=data.shape[0], ncols=1, figsize=(16, 16), sharex=True)
+    fig = plt.figure(num=FIGURE_NAME)
+    fig.set_size_inches(16, 16)
+    fig.clf()
+    axes = fig.subplots(nrows=data.shape[0], ncols=1, sharex=True, squeeze=False)[:, 0]
     fig.suptitle(f'file: {file_path}', fontsize=16)
     X = 0
 
@@ -77,7 +84,7 @@ Notes:
         axes[j].set_ylim(-1 * amplitude, amplitude)
         axes[j].set_yticks([])
         axes[j].set_xticks([])
-        axes[j].plot(emg_signal, label=f'Channel {j + 1}')
+        axes[j].plot(*minmax_decimate(emg_signal), label=f'Channel {j + 1}')
 
 
 
@@ -101,10 +108,10 @@ Notes:
 """
 
 
-    data = np.loadtxt(file_path, delimiter=',')
+    data = load_csv(file_path)
     data = data.transpose()
     unit_label = "mV"
-    if max([max(x) for x in data[5:20]]) > 500:
+    if data[5:20].max() > 500:
         unit_label = "raw input"
     elif MICRO_VOLTS:
         data = data * 1e3
@@ -112,11 +119,13 @@ Notes:
     
     
 
-    plt.clf()
-    plt.figure(figsize=(15, 5))
-    plt.ylabel(unit_label)
+    fig = plt.figure(num=FIGURE_NAME)
+    fig.set_size_inches(15, 5)
+    fig.clf()
+    ax = fig.add_subplot()
+    ax.set_ylabel(unit_label)
 
-    plt.plot(data[channel-1])
+    ax.plot(*minmax_decimate(data[channel-1]))
 
 
 